@@ -11,7 +11,7 @@ from alembic import context
 
 # Import Base and models for autogenerate support
 from app.db.database import Base
-from app.core.config import settings
+from app.core.config import get_settings
 
 # Import all models to ensure they're registered with Base
 from app.models import user, session  # noqa: F401
@@ -21,7 +21,7 @@ from app.models import user, session  # noqa: F401
 config = context.config
 
 # Override sqlalchemy.url with our DATABASE_URL from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", get_settings().DATABASE_URL)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,87 @@
+"""Add composite indexes for listing todos and filtering by tag
+
+Revision ID: 6d687c0b9498
+Revises: c93ad334c6da
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "6d687c0b9498"
+down_revision = "c93ad334c6da"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_user_created",
+            "todos",
+            ["user_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_todos_user_status",
+            "todos",
+            ["user_id", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_todo_tags_tag_todo",
+            "todo_tags",
+            ["tag_id", "todo_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Superseded by the composite indexes above
+        op.drop_index(
+            "ix_todos_user_id", table_name="todos", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_todos_status", table_name="todos", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_todos_created_at", table_name="todos", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_created_at",
+            "todos",
+            ["created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_todos_status",
+            "todos",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_todos_user_id",
+            "todos",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_todo_tags_tag_todo",
+            table_name="todo_tags",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_todos_user_status", table_name="todos", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_todos_user_created", table_name="todos", postgresql_concurrently=True
+        )
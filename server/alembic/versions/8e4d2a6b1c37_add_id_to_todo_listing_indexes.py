@@ -0,0 +1,71 @@
+"""Append id to the todos listing indexes to match the keyset order
+
+Revision ID: 8e4d2a6b1c37
+Revises: f2b7c41e9a05
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "8e4d2a6b1c37"
+down_revision = "f2b7c41e9a05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_user_created_id",
+            "todos",
+            ["user_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_todos_user_status_created_id",
+            "todos",
+            ["user_id", "status", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Prefixes of the indexes above
+        op.drop_index(
+            "ix_todos_user_created", table_name="todos", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_todos_user_status_created",
+            table_name="todos",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_user_created",
+            "todos",
+            ["user_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_todos_user_status_created",
+            "todos",
+            ["user_id", "status", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_todos_user_created_id",
+            table_name="todos",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_todos_user_status_created_id",
+            table_name="todos",
+            postgresql_concurrently=True,
+        )
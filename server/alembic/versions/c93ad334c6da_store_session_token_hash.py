@@ -0,0 +1,39 @@
+"""Store SHA-256 of session tokens instead of plaintext tokens
+
+Revision ID: c93ad334c6da
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c93ad334c6da"
+down_revision = "a1b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sessions", sa.Column("token_hash", sa.LargeBinary(length=32), nullable=True)
+    )
+    # Hash existing tokens in place so active sessions survive the migration
+    op.execute("UPDATE sessions SET token_hash = sha256(convert_to(token, 'UTF8'))")
+    op.alter_column("sessions", "token_hash", nullable=False)
+    op.create_index(
+        op.f("ix_sessions_token_hash"), "sessions", ["token_hash"], unique=True
+    )
+    op.drop_index(op.f("ix_sessions_token"), table_name="sessions")
+    op.drop_column("sessions", "token")
+
+
+def downgrade() -> None:
+    # Plaintext tokens cannot be recovered from their hashes: drop all sessions
+    op.execute("DELETE FROM sessions")
+    op.add_column("sessions", sa.Column("token", sa.String(length=255), nullable=False))
+    op.create_index(op.f("ix_sessions_token"), "sessions", ["token"], unique=True)
+    op.drop_index(op.f("ix_sessions_token_hash"), table_name="sessions")
+    op.drop_column("sessions", "token_hash")
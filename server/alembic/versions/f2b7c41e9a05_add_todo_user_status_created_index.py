@@ -0,0 +1,47 @@
+"""Extend the todos status index with created_at for ordered pagination
+
+Revision ID: f2b7c41e9a05
+Revises: 6d687c0b9498
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f2b7c41e9a05"
+down_revision = "6d687c0b9498"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_user_status_created",
+            "todos",
+            ["user_id", "status", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Prefix of the index above
+        op.drop_index(
+            "ix_todos_user_status", table_name="todos", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_todos_user_status",
+            "todos",
+            ["user_id", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_todos_user_status_created",
+            table_name="todos",
+            postgresql_concurrently=True,
+        )
@@ -2,10 +2,10 @@
 Authentication API endpoints.
 """
 
-from fastapi import APIRouter, Depends, status, HTTPException, Header
+from fastapi import APIRouter, Depends, status, HTTPException, Response
 from app.schemas.auth import SignUpRequest, SignInRequest, SignInResponse, UserResponse
 from app.services.auth_service import AuthService
-from app.api.deps import get_auth_service
+from app.api.deps import get_auth_service, get_bearer_token
 from app.core.exceptions import (
     UserAlreadyExistsError,
     InvalidCredentialsError,
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 @router.post(
     "/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
-async def signup(
+def signup(
     signup_data: SignUpRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ):
@@ -45,7 +45,11 @@ async def signup(
             name=signup_data.name,
             password=signup_data.password,
         )
-        return UserResponse.model_validate(user)
+        return Response(
+            content=UserResponse.from_orm_fast(user).model_dump_json(),
+            media_type="application/json",
+            status_code=status.HTTP_201_CREATED,
+        )
     except UserAlreadyExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -54,7 +58,7 @@ async def signup(
 
 
 @router.post("/signin", response_model=SignInResponse)
-async def signin(
+def signin(
     signin_data: SignInRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ):
@@ -78,10 +82,13 @@ async def signin(
             email=signin_data.email,
             password=signin_data.password,
         )
-        return SignInResponse(
-            user=UserResponse.model_validate(user),
+        response = SignInResponse(
+            user=UserResponse.from_orm_fast(user),
             token=token,
         )
+        return Response(
+            content=response.model_dump_json(), media_type="application/json"
+        )
     except InvalidCredentialsError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -90,8 +97,8 @@ async def signin(
 
 
 @router.post("/signout", status_code=status.HTTP_200_OK)
-async def signout(
-    authorization: str = Header(..., description="Bearer token"),
+def signout(
+    token: str = Depends(get_bearer_token),
     auth_service: AuthService = Depends(get_auth_service),
 ):
     """
@@ -100,7 +107,7 @@ async def signout(
     Invalidates the session token provided in the Authorization header.
 
     Args:
-        authorization: Authorization header (format: "Bearer {token}")
+        token: Session token from the Authorization header
         auth_service: AuthService dependency
 
     Returns:
@@ -109,15 +116,6 @@ async def signout(
     Raises:
         HTTPException 401: If token is invalid or not found
     """
-    # Extract token from Authorization header
-    if not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format. Use 'Bearer {token}'",
-        )
-
-    token = authorization.replace("Bearer ", "")
-
     try:
         auth_service.signout(token)
         return {"message": "Successfully signed out"}
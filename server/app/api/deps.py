@@ -2,7 +2,8 @@
 Dependency functions for FastAPI endpoints.
 """
 
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.user import User
@@ -11,70 +12,94 @@ from app.services.todo_service import TodoService
 from app.repositories.user_repository import UserRepository
 from app.repositories.session_repository import SessionRepository
 from app.repositories.todo_repository import TodoRepository
-from app.core.exceptions import SessionNotFoundError, SessionExpiredError
+from app.core.exceptions import SessionNotFoundError
 
+# Parses "Authorization: Bearer {token}" and documents the scheme in OpenAPI.
+# auto_error is off so a missing or malformed header is reported as 401
+# rather than HTTPBearer's default 403.
+bearer_scheme = HTTPBearer(auto_error=False)
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+
+async def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     """
     Dependency to create AuthService instance.
 
+    Declared async because it performs no I/O: FastAPI calls coroutine
+    dependencies inline instead of dispatching them to the threadpool.
+
     Args:
         db: Database session
 
     Returns:
         AuthService instance
     """
-    user_repo = UserRepository(db)
-    session_repo = SessionRepository(db)
-    return AuthService(user_repo, session_repo)
+    return AuthService(UserRepository(db), SessionRepository(db))
 
 
-async def get_current_user(
-    authorization: str = Header(..., description="Bearer token"),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> User:
+async def get_bearer_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> str:
     """
-    Dependency to get the current authenticated user.
+    Dependency to extract the session token from the Authorization header.
 
     Args:
-        authorization: Authorization header (format: "Bearer {token}")
-        auth_service: AuthService instance
+        credentials: Parsed Authorization header (format: "Bearer {token}")
 
     Returns:
-        Current user instance
+        Session token
 
     Raises:
-        HTTPException: 401 if token is invalid, missing, or expired
+        HTTPException: 401 if the header is missing or not in
+            "Bearer {token}" format
     """
-    # Extract token from Authorization header
-    if not authorization.startswith("Bearer "):
+    if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization header format. Use 'Bearer {token}'",
+            headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token = authorization.replace("Bearer ", "")
+    return credentials.credentials
+
+
+def get_current_user(
+    token: str = Depends(get_bearer_token),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> User:
+    """
+    Dependency to get the current authenticated user.
+
+    Args:
+        token: Session token from the Authorization header
+        auth_service: AuthService instance
+
+    Returns:
+        Current user instance
 
+    Raises:
+        HTTPException: 401 if token is invalid, missing, or expired
+    """
     # Get user from token
     try:
         user = auth_service.get_current_user(token)
         return user
-    except (SessionNotFoundError, SessionExpiredError) as e:
+    except SessionNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
         )
 
 
-def get_todo_service(db: Session = Depends(get_db)) -> TodoService:
+async def get_todo_service(db: Session = Depends(get_db)) -> TodoService:
     """
     Dependency to create TodoService instance.
 
+    Declared async for the same reason as get_auth_service.
+
     Args:
         db: Database session
 
     Returns:
         TodoService instance
     """
-    todo_repo = TodoRepository(db)
-    return TodoService(todo_repo)
+    return TodoService(TodoRepository(db))
@@ -2,8 +2,8 @@
 Todo API endpoints.
 """
 
-from fastapi import APIRouter, Depends, status, HTTPException, Query
-from app.schemas.todo import TodoResponse, TodoCreate
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
+from app.schemas.todo import TodoResponse, TodoCreate, TODO_LIST_ADAPTER
 from app.services.todo_service import TodoService
 from app.api.deps import get_current_user, get_todo_service
 from app.models.user import User
@@ -13,11 +13,11 @@ router = APIRouter(prefix="/api/todos", tags=["todos"])
 
 
 @router.post("/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
-async def create_todo(
+def create_todo(
     todo_data: TodoCreate,
     current_user: User = Depends(get_current_user),
     todo_service: TodoService = Depends(get_todo_service),
-) -> TodoResponse:
+) -> Response:
     """
     Create a new TODO for the authenticated user.
 
@@ -32,7 +32,11 @@ async def create_todo(
     """
     try:
         todo = todo_service.create_todo(current_user.id, todo_data)
-        return todo
+        return Response(
+            content=TodoResponse.from_orm_fast(todo).model_dump_json(),
+            media_type="application/json",
+            status_code=status.HTTP_201_CREATED,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -41,29 +45,49 @@ async def create_todo(
 
 
 @router.get("/", response_model=list[TodoResponse])
-async def list_todos(
-    status_filter: str | None = Query(None, alias="status", description="Filter by status (pending, in_progress, completed)"),
-    tag_ids: str | None = Query(None, description="Comma-separated tag IDs to filter by"),
-    limit: int = Query(50, ge=1, le=100, description="Maximum number of results (1-100)"),
+def list_todos(
+    status_filter: str | None = Query(
+        None,
+        alias="status",
+        description="Filter by status (pending, in_progress, completed)",
+    ),
+    tag_ids: list[str] | None = Query(
+        None, description="Tag IDs to filter by, comma-separated and/or repeated"
+    ),
+    limit: int = Query(
+        50, ge=1, le=100, description="Maximum number of results (1-100)"
+    ),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's X-Next-Cursor header"
+    ),
     current_user: User = Depends(get_current_user),
     todo_service: TodoService = Depends(get_todo_service),
-) -> list[TodoResponse]:
+) -> Response:
     """
     List authenticated user's TODOs with optional filters.
 
     Supports filtering by:
     - status: pending, in_progress, or completed
-    - tag_ids: comma-separated list of tag IDs (e.g., "1,2,3")
-    - pagination: limit (max 100) and offset
+    - tag_ids: comma-separated list of tag IDs (e.g., "1,2,3"), or repeated
+      parameters (e.g., "tag_ids=1&tag_ids=2")
+    - pagination: limit (max 100) and either offset or cursor
 
-    Returns TODOs ordered by created_at DESC (newest first).
+    Returns TODOs ordered by created_at DESC (newest first). When more TODOs
+    follow, the X-Next-Cursor response header holds the cursor for the next
+    page; pass it back as `cursor` to continue.
     """
-    # Parse tag_ids from comma-separated string to list[int]
+    # Parse tag_ids (comma-separated and/or repeated) to list[int] in one pass;
+    # int() already tolerates surrounding whitespace
     tag_id_list: list[int] | None = None
     if tag_ids:
         try:
-            tag_id_list = [int(id.strip()) for id in tag_ids.split(",") if id.strip()]
+            tag_id_list = [
+                int(part)
+                for value in tag_ids
+                for part in value.split(",")
+                if part and not part.isspace()
+            ]
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -72,14 +96,23 @@ async def list_todos(
 
     # Get TODOs from service
     try:
-        todos = todo_service.get_todos_for_user(
+        todos, next_cursor = todo_service.get_todos_for_user(
             user_id=current_user.id,
             status=status_filter,
             tag_ids=tag_id_list,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+        )
+        response = Response(
+            content=TODO_LIST_ADAPTER.dump_json(
+                [TodoResponse.from_orm_fast(todo) for todo in todos]
+            ),
+            media_type="application/json",
         )
-        return todos
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return response
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -2,6 +2,9 @@
 Application configuration using Pydantic settings.
 """
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -14,11 +17,17 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 3600  # seconds; beat server-side idle timeouts
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection before erroring
 
     # Security
     SECRET_KEY: str
     SESSION_EXPIRE_MINUTES: int = 1440  # 24 hours
-    BCRYPT_ROUNDS: int = 12
+    SESSION_CACHE_TTL_SECONDS: int = 30  # In-process token -> user cache; 0 disables
+    BCRYPT_ROUNDS: int = 12  # Lower (e.g. 10) only for dev/test environments
+    PASSWORD_SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"  # Hash for new passwords
 
     # Server
     HOST: str = "0.0.0.0"
@@ -29,4 +38,16 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    The environment and .env file are read once per process. Modules
+    copy the values they need at import time, so settings must be set in
+    the environment before the app is imported.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
@@ -0,0 +1,52 @@
+"""
+Opaque cursors for keyset pagination.
+"""
+
+import base64
+from datetime import datetime
+
+import orjson
+
+
+def encode_cursor(created_at: datetime, todo_id: int) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        created_at: created_at of the last row returned
+        todo_id: ID of the last row returned
+
+    Returns:
+        URL-safe base64 cursor string, without padding
+    """
+    payload = orjson.dumps({"c": created_at.isoformat(), "id": todo_id})
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        (created_at, id) of the last row on the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = orjson.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        created_at = datetime.fromisoformat(payload["c"])
+        todo_id = payload["id"]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    # bool is an int subclass; reject it like any other non-integer ID
+    if isinstance(todo_id, bool) or not isinstance(todo_id, int):
+        raise ValueError("Invalid cursor")
+
+    return created_at, todo_id
@@ -2,17 +2,28 @@
 Security utilities for password hashing and verification.
 """
 
+import hashlib
 import secrets
 from passlib.context import CryptContext
-from app.core.config import settings
+from app.core.config import get_settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. bcrypt stays registered as a fallback so hashes
+# created before a PASSWORD_SCHEME change still verify; needs_rehash() flags
+# them so signin can replace them with the configured scheme.
+_settings = get_settings()
+pwd_context = CryptContext(
+    schemes=list(dict.fromkeys([_settings.PASSWORD_SCHEME, "bcrypt"])),
+    bcrypt__rounds=_settings.BCRYPT_ROUNDS,
+    deprecated="auto",
+)
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using the configured scheme (bcrypt by default).
+
+    CPU-bound by design: only call it from sync (def) endpoints, which FastAPI
+    runs in its threadpool, never directly from an async def.
 
     Args:
         password: Plain text password
@@ -20,28 +31,71 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password, rounds=settings.BCRYPT_ROUNDS)
+    return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
 
+    CPU-bound like hash_password; the same threadpool rule applies.
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password to compare against
 
     Returns:
-        True if password matches, False otherwise
+        True if password matches, False otherwise (including for a hash
+        that is not in any recognized format)
     """
+    # A malformed hash can never match; skip the hashing work for it
+    if not hashed_password or pwd_context.identify(hashed_password) is None:
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses a scheme other than PASSWORD_SCHEME.
+
+    Args:
+        hashed_password: Hash of a password that has just been verified
+
+    Returns:
+        True if the password should be hashed again and stored
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
+# Verified against when no user matches the email, so that signin takes the
+# same time whether or not the account exists. Hashed once at import.
+DUMMY_PASSWORD_HASH = hash_password(secrets.token_urlsafe(16))
+
+
 def generate_token() -> str:
     """
     Generate a secure random token for session management.
 
+    128 bits of randomness is ample for an unguessable bearer token and
+    keeps the Authorization header short (22 base64url characters).
+
+    Returns:
+        URL-safe random token string (16 bytes)
+    """
+    return secrets.token_urlsafe(16)
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Hash a session token for storage and lookup.
+
+    Only this digest is persisted, so a leaked sessions table does not
+    expose usable tokens, and the indexed key is a fixed 32 bytes.
+
+    Args:
+        token: Plain session token as issued to the client
+
     Returns:
-        URL-safe random token string (32 bytes)
+        SHA-256 digest of the token (32 bytes)
     """
-    return secrets.token_urlsafe(32)
+    return hashlib.sha256(token.encode()).digest()
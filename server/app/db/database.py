@@ -2,18 +2,32 @@
 SQLAlchemy database configuration and session management.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.config import get_settings
+
+
+def _create_engine() -> Engine:
+    """
+    Create the database engine from the application settings.
+
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    settings = get_settings()
+    return create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,  # Verify connections before using
+        pool_size=settings.DB_POOL_SIZE,  # Connection pool size
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Max connections beyond pool_size
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections older than this
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Wait this long for a free connection
+    )
+
 
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,  # Connection pool size
-    max_overflow=10,  # Max connections beyond pool_size
-)
+engine = _create_engine()
 
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -4,7 +4,7 @@ FastAPI application entry point for TODO App Demo Server.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.api import auth_router, todos_router
 
 # Create FastAPI application instance
@@ -14,6 +14,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson encodes in C, incl. datetimes
 )
 
 # Configure CORS middleware
@@ -26,6 +27,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Let the frontend read list cursors
 )
 
 
@@ -49,7 +51,7 @@ async def health_check():
     Returns:
         dict: Health status with service name and status
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "status": "healthy",
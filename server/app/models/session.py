@@ -2,7 +2,7 @@
 Session model for user authentication tokens.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, LargeBinary, DateTime, ForeignKey, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -17,7 +17,9 @@ class Session(Base):
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    token = Column(String(255), unique=True, nullable=False, index=True)
+    token_hash = Column(
+        LargeBinary(32), unique=True, nullable=False, index=True
+    )  # SHA-256 of the issued token; the token itself is never stored
     expires_at = Column(DateTime(timezone=True), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     created_at = Column(
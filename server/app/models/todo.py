@@ -3,7 +3,16 @@ Todo model for task items.
 """
 
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    Index,
+    Enum as SQLEnum,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -23,19 +32,18 @@ class Todo(Base):
     __tablename__ = "todos"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(
         SQLEnum(TodoStatus),
         nullable=False,
         default=TodoStatus.PENDING,
-        index=True,
     )
     starts_date = Column(DateTime(timezone=True), nullable=True)
     expires_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at = Column(
         DateTime(timezone=True),
@@ -44,6 +52,16 @@ class Todo(Base):
         nullable=False,
     )
 
+    # Composite indexes for listing a user's TODOs newest-first, optionally by
+    # status, as an index range scan in (created_at, id) keyset order; they
+    # also cover plain user_id lookups
+    __table_args__ = (
+        Index("ix_todos_user_created_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_todos_user_status_created_id", "user_id", "status", "created_at", "id"
+        ),
+    )
+
     # Relationships
     user = relationship("User", backref="todos")
     tags = relationship("Tag", secondary="todo_tags", back_populates="todos")
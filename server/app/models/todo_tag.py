@@ -2,7 +2,7 @@
 TodoTag association model for many-to-many relationship between TODOs and Tags.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from app.db.database import Base
 
@@ -13,14 +13,20 @@ class TodoTag(Base):
     __tablename__ = "todo_tags"
 
     id = Column(Integer, primary_key=True, index=True)
-    todo_id = Column(Integer, ForeignKey("todos.id"), nullable=False)
-    tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
+    todo_id = Column(
+        Integer, ForeignKey("todos.id", ondelete="CASCADE"), nullable=False
+    )
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
-    # Unique constraint to prevent duplicate tag assignments
-    __table_args__ = (UniqueConstraint("todo_id", "tag_id", name="uq_todo_tag"),)
+    # Unique constraint to prevent duplicate tag assignments (also serves
+    # todo_id lookups); the reverse index serves tag_id filters
+    __table_args__ = (
+        UniqueConstraint("todo_id", "tag_id", name="uq_todo_tag"),
+        Index("ix_todo_tags_tag_todo", "tag_id", "todo_id"),
+    )
 
     def __repr__(self) -> str:
         return f"<TodoTag(id={self.id}, todo_id={self.todo_id}, tag_id={self.tag_id})>"
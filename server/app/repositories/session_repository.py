@@ -2,15 +2,68 @@
 Repository for Session data access.
 """
 
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session as DBSession
+from typing import Any
+
+from sqlalchemy import DateTime, bindparam, func, insert, literal, select, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.orm import Session as DBSession, joinedload
+from sqlalchemy.sql.functions import FunctionElement
 from app.models.session import Session
-from app.core.config import settings
+from app.core.config import get_settings
+from app.core.security import hash_token
+
+# Session lifetime, resolved once instead of on every sign-in
+SESSION_EXPIRE_MINUTES = get_settings().SESSION_EXPIRE_MINUTES
+
+
+class _MinutesFromNow(FunctionElement):
+    """Database-side timestamp N minutes after the current time."""
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+    def __init__(self, minutes: int) -> None:
+        super().__init__(literal(minutes))
+
+
+@compiles(_MinutesFromNow)
+def _compile_minutes_from_now(
+    element: _MinutesFromNow, compiler: SQLCompiler, **kw: Any
+) -> str:
+    (minutes,) = element.clauses
+    return compiler.process(
+        func.now() + func.make_interval(0, 0, 0, 0, 0, minutes), **kw
+    )
+
+
+# Test support only: the test suite runs on in-memory SQLite, which has no
+# make_interval(). The application itself always runs on PostgreSQL.
+@compiles(_MinutesFromNow, "sqlite")
+def _compile_minutes_from_now_sqlite(
+    element: _MinutesFromNow, compiler: SQLCompiler, **kw: Any
+) -> str:
+    (minutes,) = element.clauses
+    return "datetime('now', '+' || %s || ' minutes')" % compiler.process(minutes, **kw)
+
+
+# Active-session lookup by token hash, built once and reused for every request
+_GET_BY_TOKEN_HASH = (
+    select(Session)
+    .options(joinedload(Session.user))
+    .where(
+        Session.token_hash == bindparam("token_hash"),
+        Session.is_active.is_(True),
+        Session.expires_at > func.now(),
+    )
+)
 
 
 class SessionRepository:
     """Repository for Session database operations."""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: DBSession) -> None:
         """
         Initialize SessionRepository.
@@ -24,56 +77,76 @@ class SessionRepository:
         """
         Create a new session.
 
+        The expiry is computed by the database from its own clock, so it is
+        consistent with the now() comparisons used by the lookups below.
+        The row is read back with INSERT ... RETURNING rather than a separate
+        refresh SELECT.
+
         Args:
             user_id: User ID for the session
-            token: Session token
+            token: Session token (only its hash is stored)
 
         Returns:
             Created Session instance
         """
-        expires_at = datetime.utcnow() + timedelta(
-            minutes=settings.SESSION_EXPIRE_MINUTES
-        )
-        session = Session(
-            user_id=user_id, token=token, expires_at=expires_at, is_active=True
-        )
-        self.db.add(session)
+        session = self.db.scalars(
+            insert(Session)
+            .values(
+                user_id=user_id,
+                token_hash=hash_token(token),
+                expires_at=_MinutesFromNow(SESSION_EXPIRE_MINUTES),
+                is_active=True,
+            )
+            .returning(Session)
+        ).one()
         self.db.commit()
-        self.db.refresh(session)
         return session
 
     def get_by_token(self, token: str) -> Session | None:
         """
-        Get session by token.
+        Get an active, unexpired session by token, with its user loaded.
+
+        Sessions are looked up by the SHA-256 of the token, so the raw token
+        is never compared against stored values. The user is joined into the
+        same query and expiry is checked in SQL, so resolving a token costs a
+        single round trip.
 
         Args:
             token: Session token to search for
 
         Returns:
-            Session instance if found, None otherwise
+            Session instance (with session.user loaded) if found, None otherwise
         """
-        return (
-            self.db.query(Session)
-            .filter(Session.token == token, Session.is_active.is_(True))
-            .first()
-        )
+        return self.db.scalars(
+            _GET_BY_TOKEN_HASH, {"token_hash": hash_token(token)}
+        ).first()
 
     def delete(self, token: str) -> bool:
         """
         Delete (deactivate) a session by token.
 
+        Expiry is not checked: signing out of an expired session still
+        deactivates it.
+
         Args:
             token: Session token to delete
 
         Returns:
             True if session was deleted, False if not found
         """
-        session = self.get_by_token(token)
-        if session:
-            session.is_active = False
-            self.db.commit()
-            return True
-        return False
+        # Single UPDATE instead of SELECT-then-flush; in-memory Session objects
+        # are not synchronized since callers don't hold on to them
+        result = self.db.execute(
+            update(Session)
+            .where(
+                Session.token_hash == hash_token(token),
+                Session.is_active.is_(True),
+            )
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount > 0
 
     def delete_expired(self) -> int:
         """
@@ -82,23 +155,10 @@ class SessionRepository:
         Returns:
             Number of sessions deleted
         """
-        now = datetime.utcnow()
         result = (
             self.db.query(Session)
-            .filter(Session.expires_at < now, Session.is_active.is_(True))
-            .update({"is_active": False})
+            .filter(Session.expires_at < func.now(), Session.is_active.is_(True))
+            .update({"is_active": False}, synchronize_session=False)
         )
         self.db.commit()
         return result
-
-    def is_expired(self, session: Session) -> bool:
-        """
-        Check if a session is expired.
-
-        Args:
-            session: Session to check
-
-        Returns:
-            True if expired, False otherwise
-        """
-        return datetime.utcnow() > session.expires_at
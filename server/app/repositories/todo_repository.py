@@ -2,14 +2,27 @@
 Repository for Todo data access.
 """
 
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+
+from sqlalchemy import bindparam, delete, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 from app.models.todo import Todo, TodoStatus
 from app.models.tag import Tag
+from app.models.todo_tag import TodoTag
+
+# Keyset of the last row on the previous page, as named bind parameters that
+# get_all_for_user fills in at execution time
+_BEFORE_KEYSET = tuple_(
+    bindparam("before_created_at", type_=Todo.created_at.type),
+    bindparam("before_id", type_=Todo.id.type),
+)
 
 
 class TodoRepository:
     """Repository for Todo database operations."""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session) -> None:
         """
         Initialize TodoRepository.
@@ -19,22 +32,39 @@ class TodoRepository:
         """
         self.db = db
 
-    def get_by_id(self, todo_id: int) -> Todo | None:
+    def get_for_user(self, todo_id: int, user_id: int) -> Todo | None:
         """
-        Get TODO by ID with eager loading of tags.
+        Get a user's TODO by ID with eager loading of tags.
+
+        Ownership is part of the WHERE clause, so another user's TODO is
+        never loaded.
 
         Args:
             todo_id: TODO ID to search for
+            user_id: ID of the user who must own the TODO
 
         Returns:
-            Todo instance if found, None otherwise
+            Todo instance if found and owned by the user, None otherwise
         """
-        return (
-            self.db.query(Todo)
-            .options(joinedload(Todo.tags))
-            .filter(Todo.id == todo_id)
-            .first()
+        stmt = (
+            select(Todo)
+            .options(selectinload(Todo.tags))
+            .where(Todo.id == todo_id, Todo.user_id == user_id)
         )
+        return self.db.scalars(stmt).one_or_none()
+
+    def exists(self, todo_id: int) -> bool:
+        """
+        Check whether a TODO with the given ID exists, for any user.
+
+        Args:
+            todo_id: TODO ID to check
+
+        Returns:
+            True if the TODO exists, False otherwise
+        """
+        stmt = select(Todo.id).where(Todo.id == todo_id).limit(1)
+        return self.db.scalar(stmt) is not None
 
     def get_all_for_user(
         self,
@@ -43,6 +73,7 @@ class TodoRepository:
         tag_ids: list[int] | None = None,
         limit: int = 50,
         offset: int = 0,
+        before: tuple[datetime, int] | None = None,
     ) -> list[Todo]:
         """
         Get all TODOs for a user with optional filters.
@@ -53,32 +84,49 @@ class TodoRepository:
             tag_ids: Optional list of tag IDs to filter by
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            before: Optional (created_at, id) keyset; only TODOs sorting
+                after it (older, or same time with a lower ID) are returned
 
         Returns:
             List of Todo instances matching the filters
         """
-        query = self.db.query(Todo).filter(Todo.user_id == user_id)
+        # Built as a lambda statement: SQLAlchemy caches the construction and
+        # compilation per combination of filters, and the closure values
+        # (user_id, status, tag_ids, limit, offset) become bound parameters
+        stmt = lambda_stmt(lambda: select(Todo).where(Todo.user_id == user_id))
 
         # Apply status filter
         if status:
-            query = query.filter(Todo.status == status)
+            stmt += lambda s: s.where(Todo.status == status)
 
         # Apply tag filter
         if tag_ids:
-            # Join with tags and filter by tag IDs
-            # Use distinct() to avoid duplicate TODOs when multiple tags match
-            query = query.join(Todo.tags).filter(Tag.id.in_(tag_ids)).distinct()
-
-        # Eager load tags to avoid N+1 queries
-        query = query.options(joinedload(Todo.tags))
+            # Semi-join on the association table: each TODO appears once no
+            # matter how many of its tags match, so no DISTINCT is needed
+            stmt += lambda s: s.where(
+                Todo.id.in_(select(TodoTag.todo_id).where(TodoTag.tag_id.in_(tag_ids)))
+            )
 
-        # Order by created_at DESC (newest first)
-        query = query.order_by(Todo.created_at.desc())
+        # Keyset pagination: seek past the previous page through the
+        # (user_id, created_at, id) index instead of scanning and discarding rows
+        params: dict[str, object] = {}
+        if before:
+            params["before_created_at"], params["before_id"] = before
+            stmt += lambda s: s.where(tuple_(Todo.created_at, Todo.id) < _BEFORE_KEYSET)
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Load tags with one extra SELECT ... WHERE todo_id IN (...) instead of
+        # a LEFT OUTER JOIN that repeats every TODO row once per tag; any other
+        # relationship access on the results raises instead of lazy-loading.
+        # Then order newest first, ID breaking ties so the keyset is total,
+        # and paginate.
+        stmt += lambda s: (
+            s.options(selectinload(Todo.tags), raiseload("*"))
+            .order_by(Todo.created_at.desc(), Todo.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
 
-        return query.all()
+        return list(self.db.scalars(stmt, params).all())
 
     def create(
         self,
@@ -104,6 +152,9 @@ class TodoRepository:
 
         Returns:
             Created Todo instance
+
+        Raises:
+            ValueError: If any tag ID does not exist
         """
         todo = Todo(
             user_id=user_id,
@@ -116,8 +167,7 @@ class TodoRepository:
 
         # Add tags if provided
         if tag_ids:
-            tags = self.db.query(Tag).filter(Tag.id.in_(tag_ids)).all()
-            todo.tags = tags
+            todo.tags = self._get_tags(tag_ids)
 
         self.db.add(todo)
         self.db.commit()
@@ -134,12 +184,14 @@ class TodoRepository:
 
         Returns:
             Updated Todo instance
+
+        Raises:
+            ValueError: If any tag ID does not exist
         """
         # Handle tag_ids separately
         tag_ids = kwargs.pop("tag_ids", None)
         if tag_ids is not None:
-            tags = self.db.query(Tag).filter(Tag.id.in_(tag_ids)).all()
-            todo.tags = tags
+            todo.tags = self._get_tags(tag_ids)
 
         # Update other fields
         for key, value in kwargs.items():
@@ -150,12 +202,83 @@ class TodoRepository:
         self.db.refresh(todo)
         return todo
 
-    def delete(self, todo: Todo) -> None:
+    def update_for_user(self, todo_id: int, user_id: int, **kwargs) -> Todo | None:
         """
-        Delete a TODO.
+        Update a user's TODO columns without loading it first.
+
+        Issues UPDATE ... RETURNING filtered on ownership, then loads the
+        tags for the response. Tags themselves cannot be changed this way;
+        use update() for that. The returned TODO is detached from the
+        session so the commit does not expire it.
 
         Args:
-            todo: Todo instance to delete
+            todo_id: TODO ID to update
+            user_id: ID of the user who must own the TODO
+            **kwargs: Column fields to update (None values are ignored)
+
+        Returns:
+            Updated Todo instance, or None if not found or not owned
         """
-        self.db.delete(todo)
+        values = {
+            key: value
+            for key, value in kwargs.items()
+            if value is not None and key != "tag_ids"
+        }
+        if not values:
+            return self.get_for_user(todo_id, user_id)
+
+        stmt = (
+            update(Todo)
+            .where(Todo.id == todo_id, Todo.user_id == user_id)
+            .values(**values)
+            .returning(Todo)
+            .options(selectinload(Todo.tags))
+        )
+        todo = self.db.scalars(stmt).one_or_none()
+        if todo is not None:
+            for tag in todo.tags:
+                self.db.expunge(tag)
+            self.db.expunge(todo)
+        self.db.commit()
+        return todo
+
+    def _get_tags(self, tag_ids: list[int]) -> list[Tag]:
+        """
+        Load tags by ID with a single IN query.
+
+        Args:
+            tag_ids: Tag IDs to load (duplicates are ignored)
+
+        Returns:
+            List of Tag instances
+
+        Raises:
+            ValueError: If any tag ID does not exist
+        """
+        unique_ids = set(tag_ids)
+        if not unique_ids:
+            return []
+        tags = list(self.db.scalars(select(Tag).where(Tag.id.in_(unique_ids))).all())
+        if len(tags) != len(unique_ids):
+            missing = sorted(unique_ids - {tag.id for tag in tags})
+            raise ValueError(f"Tags not found: {missing}")
+        return tags
+
+    def delete_for_user(self, todo_id: int, user_id: int) -> bool:
+        """
+        Delete a user's TODO by ID without loading it.
+
+        Its todo_tags links are removed by the ON DELETE CASCADE foreign key.
+
+        Args:
+            todo_id: TODO ID to delete
+            user_id: ID of the user who must own the TODO
+
+        Returns:
+            True if the TODO was deleted, False if not found or not owned
+        """
+        result = self.db.execute(
+            delete(Todo).where(Todo.id == todo_id, Todo.user_id == user_id)
+        )
         self.db.commit()
+        return result.rowcount > 0
@@ -2,13 +2,21 @@
 Repository for User data access.
 """
 
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models.user import User
+from app.core.exceptions import UserAlreadyExistsError
+
+# Lookup by email, built once and reused for every sign-in
+_GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
 
 
 class UserRepository:
     """Repository for User database operations."""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session) -> None:
         """
         Initialize UserRepository.
@@ -28,24 +36,15 @@ class UserRepository:
         Returns:
             User instance if found, None otherwise
         """
-        return self.db.query(User).filter(User.email == email).first()
-
-    def get_by_id(self, user_id: int) -> User | None:
-        """
-        Get user by ID.
-
-        Args:
-            user_id: User ID to search for
-
-        Returns:
-            User instance if found, None otherwise
-        """
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.execute(_GET_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
     def create(self, email: str, name: str, password_hash: str) -> User:
         """
         Create a new user.
 
+        Uniqueness of the email is enforced by the database's unique index,
+        so the INSERT doubles as the existence check.
+
         Args:
             email: User's email address
             name: User's display name
@@ -53,21 +52,41 @@ class UserRepository:
 
         Returns:
             Created User instance
+
+        Raises:
+            UserAlreadyExistsError: If email is already registered
         """
         user = User(email=email, name=name, password_hash=password_hash)
         self.db.add(user)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise UserAlreadyExistsError(f"User with email {email} already exists")
         self.db.refresh(user)
         return user
 
-    def email_exists(self, email: str) -> bool:
+    def update_password_hash(self, user: User, password_hash: str) -> None:
         """
-        Check if email already exists.
+        Replace a user's stored password hash.
 
         Args:
-            email: Email address to check
+            user: User instance to update
+            password_hash: New hashed password
+        """
+        self.db.execute(
+            update(User).where(User.id == user.id).values(password_hash=password_hash)
+        )
+        self.db.commit()
 
-        Returns:
-            True if email exists, False otherwise
+    def detach(self, user: User) -> None:
+        """
+        Detach a user from the database session.
+
+        Its loaded attributes stay readable after the session commits or
+        closes, so the instance can be shared across requests.
+
+        Args:
+            user: User instance to detach
         """
-        return self.db.query(User).filter(User.email == email).first() is not None
+        self.db.expunge(user)
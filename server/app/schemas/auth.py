@@ -5,6 +5,13 @@ Pydantic schemas for authentication requests and responses.
 import re
 from datetime import datetime
 from pydantic import BaseModel, Field, field_validator, EmailStr
+from app.models.user import User
+
+# Password policy character classes, compiled once at import
+_RE_UPPER = re.compile(r"[A-Z]")
+_RE_LOWER = re.compile(r"[a-z]")
+_RE_DIGIT = re.compile(r"\d")
+_RE_SPECIAL = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
 
 
 class SignUpRequest(BaseModel):
@@ -43,16 +50,16 @@ class SignUpRequest(BaseModel):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
 
-        if not re.search(r"[A-Z]", v):
+        if not _RE_UPPER.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
 
-        if not re.search(r"[a-z]", v):
+        if not _RE_LOWER.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
 
-        if not re.search(r"\d", v):
+        if not _RE_DIGIT.search(v):
             raise ValueError("Password must contain at least one digit")
 
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if not _RE_SPECIAL.search(v):
             raise ValueError("Password must contain at least one special character")
 
         return v
@@ -61,9 +68,31 @@ class SignUpRequest(BaseModel):
 class SignInRequest(BaseModel):
     """Request schema for user login."""
 
-    email: EmailStr = Field(..., description="User's email address")
+    # Only used as a lookup key, so a cheap syntactic check is enough here;
+    # full email-validator checks run once, at signup
+    email: str = Field(
+        ...,
+        max_length=320,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+        description="User's email address",
+    )
     password: str = Field(..., description="User's password")
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email_domain(cls, v: str) -> str:
+        """
+        Lowercase the domain part, as EmailStr does for stored emails.
+
+        Args:
+            v: Email address
+
+        Returns:
+            Email address with a lowercase domain
+        """
+        local, _, domain = v.rpartition("@")
+        return f"{local}@{domain.lower()}"
+
 
 class UserResponse(BaseModel):
     """Response schema for user information."""
@@ -77,6 +106,25 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, user: User) -> "UserResponse":
+        """
+        Build a response from a trusted User row without re-validating it.
+
+        Args:
+            user: User ORM instance loaded from the database
+
+        Returns:
+            UserResponse instance
+        """
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
 
 class SignInResponse(BaseModel):
     """Response schema for successful sign in."""
@@ -3,8 +3,9 @@ Pydantic schemas for TODO operations.
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
-from app.models.todo import TodoStatus
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from app.models.tag import Tag
+from app.models.todo import Todo, TodoStatus
 
 
 class TagResponse(BaseModel):
@@ -19,6 +20,25 @@ class TagResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, tag: Tag) -> "TagResponse":
+        """
+        Build a response from a trusted Tag row without re-validating it.
+
+        Args:
+            tag: Tag ORM instance loaded from the database
+
+        Returns:
+            TagResponse instance
+        """
+        return cls.model_construct(
+            id=tag.id,
+            name=tag.name,
+            color_code=tag.color_code,
+            created_at=tag.created_at,
+            updated_at=tag.updated_at,
+        )
+
 
 class TodoCreate(BaseModel):
     """Schema for creating a new TODO."""
@@ -74,3 +94,34 @@ class TodoResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+    @classmethod
+    def from_orm_fast(cls, todo: Todo) -> "TodoResponse":
+        """
+        Build a response from a trusted Todo row without re-validating it.
+
+        The database already enforces every field's type, so this skips
+        per-field validation; todo.tags must be loaded.
+
+        Args:
+            todo: Todo ORM instance loaded from the database
+
+        Returns:
+            TodoResponse instance
+        """
+        return cls.model_construct(
+            id=todo.id,
+            user_id=todo.user_id,
+            title=todo.title,
+            description=todo.description,
+            status=todo.status,
+            starts_date=todo.starts_date,
+            expires_date=todo.expires_date,
+            created_at=todo.created_at,
+            updated_at=todo.updated_at,
+            tags=[TagResponse.from_orm_fast(tag) for tag in todo.tags],
+        )
+
+
+# Serializer for TODO list responses, built once per process
+TODO_LIST_ADAPTER = TypeAdapter(list[TodoResponse])
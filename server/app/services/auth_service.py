@@ -2,21 +2,52 @@
 Authentication service for business logic.
 """
 
+import threading
+from datetime import datetime, timezone
+from typing import cast
+
+from cachetools import TTLCache
+
 from app.repositories.user_repository import UserRepository
 from app.repositories.session_repository import SessionRepository
 from app.models.user import User
-from app.core.security import hash_password, verify_password, generate_token
+from app.core.config import get_settings
+from app.core.security import (
+    hash_password,
+    verify_password,
+    needs_rehash,
+    generate_token,
+    hash_token,
+    DUMMY_PASSWORD_HASH,
+)
 from app.core.exceptions import (
-    UserAlreadyExistsError,
     InvalidCredentialsError,
     SessionNotFoundError,
-    SessionExpiredError,
 )
 
 
+# Process-local cache of resolved sessions: token hash -> (user, expires_at).
+# Lets authenticated requests skip the session lookup for a few seconds.
+# signout evicts the entry in this process only; other workers may keep
+# accepting a revoked token for up to SESSION_CACHE_TTL_SECONDS.
+_session_cache: TTLCache = TTLCache(
+    maxsize=10_000, ttl=get_settings().SESSION_CACHE_TTL_SECONDS
+)
+_session_cache_lock = threading.Lock()
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC for comparison with utcnow()."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 class AuthService:
     """Service for authentication business logic."""
 
+    __slots__ = ("user_repo", "session_repo")
+
     def __init__(
         self, user_repo: UserRepository, session_repo: SessionRepository
     ) -> None:
@@ -45,14 +76,10 @@ class AuthService:
         Raises:
             UserAlreadyExistsError: If email is already registered
         """
-        # Check if user already exists
-        if self.user_repo.email_exists(email):
-            raise UserAlreadyExistsError(f"User with email {email} already exists")
-
         # Hash password
         password_hash = hash_password(password)
 
-        # Create user
+        # Create user; raises UserAlreadyExistsError on a duplicate email
         user = self.user_repo.create(
             email=email, name=name, password_hash=password_hash
         )
@@ -75,13 +102,18 @@ class AuthService:
         """
         # Get user by email
         user = self.user_repo.get_by_email(email)
-        if not user:
-            raise InvalidCredentialsError("Invalid email or password")
 
-        # Verify password
-        if not verify_password(password, user.password_hash):
+        # Verify password, against a dummy hash for unknown emails so the
+        # response time does not reveal whether the account exists
+        password_hash = cast(str, user.password_hash) if user else DUMMY_PASSWORD_HASH
+        if not verify_password(password, password_hash) or not user:
             raise InvalidCredentialsError("Invalid email or password")
 
+        # Migrate hashes from a previous PASSWORD_SCHEME while the plain
+        # password is at hand
+        if needs_rehash(password_hash):
+            self.user_repo.update_password_hash(user, hash_password(password))
+
         # Generate session token
         token = generate_token()
 
@@ -100,6 +132,9 @@ class AuthService:
         Raises:
             SessionNotFoundError: If token is not found
         """
+        with _session_cache_lock:
+            _session_cache.pop(hash_token(token), None)
+
         deleted = self.session_repo.delete(token)
         if not deleted:
             raise SessionNotFoundError("Session not found or already expired")
@@ -108,6 +143,11 @@ class AuthService:
         """
         Get current user from session token.
 
+        Resolved sessions are cached in-process for SESSION_CACHE_TTL_SECONDS
+        (never past the session's own expiry), so repeated requests with the
+        same token skip the database. Cached users are detached from the
+        request's database session.
+
         Args:
             token: Session token
 
@@ -115,23 +155,25 @@ class AuthService:
             User instance for the current session
 
         Raises:
-            SessionNotFoundError: If token is not found
-            SessionExpiredError: If session has expired
+            SessionNotFoundError: If token is not found or the session has expired
         """
-        # Get session by token
+        cache_key = hash_token(token)
+        with _session_cache_lock:
+            cached = _session_cache.get(cache_key)
+        if cached is not None:
+            user, expires_at = cached
+            if expires_at > datetime.utcnow():
+                return user
+
+        # Get session by token (expired sessions are filtered out in SQL,
+        # and the user is loaded by the same query)
         session = self.session_repo.get_by_token(token)
         if not session:
             raise SessionNotFoundError("Invalid or expired session token")
 
-        # Check if session is expired
-        if self.session_repo.is_expired(session):
-            # Deactivate expired session
-            self.session_repo.delete(token)
-            raise SessionExpiredError("Session has expired")
-
-        # Get user
-        user = self.user_repo.get_by_id(session.user_id)
-        if not user:
-            raise SessionNotFoundError("User not found")
+        user = session.user
+        self.user_repo.detach(user)
+        with _session_cache_lock:
+            _session_cache[cache_key] = (user, _utc_naive(session.expires_at))
 
         return user
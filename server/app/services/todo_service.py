@@ -2,15 +2,23 @@
 Todo service for business logic.
 """
 
+from datetime import datetime
+from typing import NoReturn, cast
+
 from app.repositories.todo_repository import TodoRepository
 from app.models.todo import Todo, TodoStatus
 from app.schemas.todo import TodoCreate, TodoUpdate
 from app.core.exceptions import TodoNotFoundError, UnauthorizedAccessError
+from app.core.pagination import decode_cursor, encode_cursor
+
+_VALID_STATUSES = frozenset(status.value for status in TodoStatus)
 
 
 class TodoService:
     """Service for TODO business logic."""
 
+    __slots__ = ("todo_repo",)
+
     def __init__(self, todo_repo: TodoRepository) -> None:
         """
         Initialize TodoService.
@@ -27,9 +35,10 @@ class TodoService:
         tag_ids: list[int] | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Todo]:
+        cursor: str | None = None,
+    ) -> tuple[list[Todo], str | None]:
         """
-        Get all TODOs for a user with optional filters.
+        Get a page of a user's TODOs with optional filters.
 
         Args:
             user_id: User ID to get TODOs for
@@ -37,34 +46,50 @@ class TodoService:
             tag_ids: Optional list of tag IDs to filter by
             limit: Maximum number of results (default: 50, max: 100)
             offset: Number of results to skip (default: 0)
+            cursor: Optional cursor from a previous page to continue after
 
         Returns:
-            List of Todo instances matching the filters
+            Tuple of the TODOs on this page and the cursor for the next page,
+            or None when this is the last page
 
         Raises:
-            ValueError: If status is invalid or limit exceeds maximum
+            ValueError: If status or cursor is invalid, or if both offset
+                and cursor are given
         """
         # Validate status if provided
-        if status:
-            try:
-                TodoStatus(status)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid status: {status}. Must be one of: pending, in_progress, completed"
-                )
+        if status and status not in _VALID_STATUSES:
+            raise ValueError(
+                f"Invalid status: {status}. Must be one of: pending, in_progress, completed"
+            )
+
+        # A cursor already marks where the page starts; an offset on top of
+        # it would silently skip rows
+        if cursor and offset:
+            raise ValueError("Use either offset or cursor, not both")
+
+        before = decode_cursor(cursor) if cursor else None
 
         # Cap limit at 100
         if limit > 100:
             limit = 100
 
-        # Delegate to repository
-        return self.todo_repo.get_all_for_user(
+        # Fetch one row past the page: if it comes back there is a next page,
+        # without a separate COUNT query
+        todos = self.todo_repo.get_all_for_user(
             user_id=user_id,
             status=status,
             tag_ids=tag_ids,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
+            before=before,
         )
+        if len(todos) <= limit:
+            return todos, None
+
+        del todos[limit:]
+        last = todos[-1]
+        # Column-declared attributes are typed as Column[...] on the class
+        return todos, encode_cursor(cast(datetime, last.created_at), cast(int, last.id))
 
     def get_todo(self, todo_id: int, user_id: int) -> Todo:
         """
@@ -81,13 +106,10 @@ class TodoService:
             TodoNotFoundError: If TODO doesn't exist
             UnauthorizedAccessError: If TODO belongs to different user
         """
-        todo = self.todo_repo.get_by_id(todo_id)
+        todo = self.todo_repo.get_for_user(todo_id, user_id)
 
         if not todo:
-            raise TodoNotFoundError(f"TODO with id {todo_id} not found")
-
-        if todo.user_id != user_id:
-            raise UnauthorizedAccessError("You don't have permission to access this TODO")
+            self._raise_not_found_or_unauthorized(todo_id)
 
         return todo
 
@@ -133,13 +155,20 @@ class TodoService:
             UnauthorizedAccessError: If TODO belongs to different user
             ValueError: If validation fails
         """
-        # Get and verify authorization
-        todo = self.get_todo(todo_id, user_id)
-
         # Prepare update data (only non-None fields)
         update_data = data.model_dump(exclude_unset=True)
 
-        # Update the TODO
+        # Without tag changes the TODO is updated in place with one statement
+        if update_data.get("tag_ids") is None:
+            todo = self.todo_repo.update_for_user(todo_id, user_id, **update_data)
+            if not todo:
+                self._raise_not_found_or_unauthorized(todo_id)
+            return todo
+
+        # Get and verify authorization
+        todo = self.get_todo(todo_id, user_id)
+
+        # Update the TODO and its tags
         return self.todo_repo.update(todo, **update_data)
 
     def delete_todo(self, todo_id: int, user_id: int) -> None:
@@ -154,8 +183,24 @@ class TodoService:
             TodoNotFoundError: If TODO doesn't exist
             UnauthorizedAccessError: If TODO belongs to different user
         """
-        # Get and verify authorization
-        todo = self.get_todo(todo_id, user_id)
+        # Delete only if owned; look further only when nothing was deleted
+        if not self.todo_repo.delete_for_user(todo_id, user_id):
+            self._raise_not_found_or_unauthorized(todo_id)
+
+    def _raise_not_found_or_unauthorized(self, todo_id: int) -> NoReturn:
+        """
+        Raise the error for a TODO that the user could not access.
+
+        Args:
+            todo_id: TODO ID that was requested
+
+        Raises:
+            TodoNotFoundError: If TODO doesn't exist
+            UnauthorizedAccessError: If TODO belongs to different user
+        """
+        if self.todo_repo.exists(todo_id):
+            raise UnauthorizedAccessError(
+                "You don't have permission to access this TODO"
+            )
 
-        # Delete the TODO
-        self.todo_repo.delete(todo)
+        raise TodoNotFoundError(f"TODO with id {todo_id} not found")
@@ -2,19 +2,35 @@
 Pytest fixtures for testing.
 """
 
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from app.main import app
-from app.db.database import Base, get_db
-from app.models.user import User
-from app.core.security import hash_password
+# Cheap bcrypt work factor for tests. App settings are read when app modules
+# are first imported, so it has to be set before the imports below.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from app.main import app  # noqa: E402
+from app.db.database import Base, get_db  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.tag import Tag  # noqa: E402
+from app.models.session import Session as UserSession  # noqa: E402
+from app.core.security import hash_password, generate_token, hash_token  # noqa: E402
+from app.services.auth_service import _session_cache  # noqa: E402
+
 
+# Shared by the test users; hashed once instead of per fixture call
+TEST_PASSWORD_HASH = hash_password("TestPass123!")
 
-# Create in-memory SQLite database for testing
+# Create in-memory SQLite database for testing. Each pytest-xdist worker is
+# its own process and so gets its own private database.
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
@@ -22,70 +38,231 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+# emit BEGIN itself so each test can be rolled back. Foreign keys are
+# enforced so ON DELETE CASCADE behaves as on PostgreSQL; the other pragmas
+# keep the rollback journal and temp tables in memory and skip syncs.
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "no_db: test never touches the database; skip its setup"
+    )
+
+
+def json_body(response):
+    """
+    Decode a test response body with orjson (faster than response.json()).
+    """
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache():
+    """
+    Keep the in-process session cache from leaking between tests.
+    """
+    _session_cache.clear()
+    yield
+    _session_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """
+    Create the database schema once for the whole test run.
+
+    The in-memory database starts empty, so the per-table existence checks
+    are skipped; it disappears with the process, so nothing is dropped.
+    """
+    Base.metadata.create_all(bind=engine, checkfirst=False)
 
 
 @pytest.fixture
-def test_db():
+def test_db(db_schema):
     """
-    Create a fresh database for each test.
+    Provide a database session whose changes are rolled back after each test.
+
+    The session runs inside an outer transaction; commits made by fixtures or
+    application code only release a SAVEPOINT, so nothing outlives the test.
+    Loaded attributes survive those commits, so fixture objects are not
+    re-SELECTed the next time a test reads them.
     """
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
-def client(test_db):
+def count_queries(test_db):
     """
-    Create a test client with test database.
+    Context manager collecting the SQL statements run on the test connection.
+
+    Usage:
+        with count_queries() as statements:
+            client.get(...)
+        assert len(statements) <= 2
     """
+    connection = test_db.get_bind()
+
+    @contextmanager
+    def counter():
+        statements = []
 
-    def override_get_db():
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(connection, "before_cursor_execute", record)
         try:
-            yield test_db
+            yield statements
         finally:
-            pass
+            event.remove(connection, "before_cursor_execute", record)
 
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
+    return counter
 
 
-@pytest.fixture
-def test_user(test_db):
+@pytest.fixture(scope="session")
+def reference_data(db_schema):
     """
-    Create a test user in the database.
+    Commit reference rows once per run: the test users, tags, and an active
+    session for the first user.
+
+    They are written outside any per-test transaction, so they survive the
+    rollback at the end of each test; changes a test makes to them (e.g.
+    signing out) are rolled back with it.
     """
     user = User(
         email="testuser@example.com",
         name="Test User",
-        password_hash=hash_password("TestPass123!"),
+        password_hash=TEST_PASSWORD_HASH,
     )
-    test_db.add(user)
-    test_db.commit()
-    test_db.refresh(user)
-    return user
+    tags = [
+        Tag(name="Work", color_code="#FF5733"),
+        Tag(name="Personal", color_code="#33FF57"),
+        Tag(name="Urgent", color_code="#5733FF"),
+    ]
+    user2 = User(
+        email="testuser2@example.com",
+        name="Test User 2",
+        password_hash=TEST_PASSWORD_HASH,
+    )
+    token = generate_token()
+    with Session(engine, expire_on_commit=False) as db:
+        db.add_all([user, *tags, user2])
+        db.flush()
+        db.add(
+            UserSession(
+                user_id=user.id,
+                token_hash=hash_token(token),
+                expires_at=datetime.utcnow() + timedelta(days=1),
+                is_active=True,
+            )
+        )
+        db.commit()
+    return {"user": user, "token": token, "tags": tags, "user2": user2}
 
 
 @pytest.fixture
-def authenticated_client(client, test_user):
+def test_tags(test_db, reference_data):
     """
-    Create an authenticated test client with a valid session token.
+    Test tags (Work, Personal, Urgent), attached to this test's session.
     """
-    # Sign in to get a token
-    response = client.post(
-        "/api/auth/signin",
-        json={"email": "testuser@example.com", "password": "TestPass123!"},
-    )
-    token = response.json()["token"]
+    return [test_db.merge(tag, load=False) for tag in reference_data["tags"]]
+
+
+@pytest.fixture
+def test_user2(test_db, reference_data):
+    """
+    A second test user, attached to this test's session.
+    """
+    return test_db.merge(reference_data["user2"], load=False)
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    One TestClient for the whole run, so its event-loop thread and the app
+    lifespan are started once rather than per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(app_client, request):
+    """
+    Create a test client with test database.
+
+    Tests marked no_db get no database at all; any endpoint that asks for
+    one fails the test.
+    """
+    if request.node.get_closest_marker("no_db"):
+
+        def override_get_db():
+            raise RuntimeError("Test marked no_db tried to use the database")
+            yield
+
+    else:
+        test_db = request.getfixturevalue("test_db")
+
+        def override_get_db():
+            try:
+                yield test_db
+            finally:
+                pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    # Drop state left on the shared client by the previous test
+    app_client.headers.pop("Authorization", None)
+    app_client.cookies.clear()
+    yield app_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def test_user(test_db, reference_data):
+    """
+    The test user (password "TestPass123!"), attached to this test's session.
+    """
+    return test_db.merge(reference_data["user"], load=False)
 
-    # Add authorization header to client
-    client.headers = {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def authenticated_client(client, reference_data):
+    """
+    Create an authenticated test client with a valid session token.
+
+    Reuses the test user's session created once per run instead of signing
+    in (and running bcrypt) for every test.
+    """
+    # Add authorization header to client (cleared again by the client fixture)
+    client.headers["Authorization"] = f"Bearer {reference_data['token']}"
 
     return client
@@ -2,8 +2,13 @@
 Integration tests for authentication API endpoints.
 """
 
+from datetime import datetime, timedelta
+
+import pytest
+
 from app.models.user import User
 from app.models.session import Session
+from app.core.security import hash_token
 
 
 def test_signup_creates_user_in_database(client, test_db):
@@ -143,6 +148,26 @@ def test_signin_returns_401_for_nonexistent_email(client):
     assert response.status_code == 401
 
 
+def test_signin_matches_email_domain_case_insensitively(client, test_user):
+    """Test signin normalizes the email domain like signup does."""
+    response = client.post(
+        "/api/auth/signin",
+        json={"email": "testuser@EXAMPLE.com", "password": "TestPass123!"},
+    )
+
+    assert response.status_code == 200
+
+
+def test_signin_returns_422_for_invalid_email_format(client):
+    """Test signin validation rejects a malformed email."""
+    response = client.post(
+        "/api/auth/signin",
+        json={"email": "not-an-email", "password": "Password123!"},
+    )
+
+    assert response.status_code == 422
+
+
 def test_signin_creates_session_in_database(client, test_user, test_db):
     """Test signin creates session in database."""
     response = client.post(
@@ -157,7 +182,9 @@ def test_signin_creates_session_in_database(client, test_user, test_db):
     token = response.json()["token"]
 
     # Verify session exists in database
-    session = test_db.query(Session).filter(Session.token == token).first()
+    session = (
+        test_db.query(Session).filter(Session.token_hash == hash_token(token)).first()
+    )
     assert session is not None
     assert session.user_id == test_user.id
     assert session.is_active is True
@@ -177,7 +204,9 @@ def test_signout_deletes_session_from_database(authenticated_client, test_db):
     token = authenticated_client.headers["Authorization"].replace("Bearer ", "")
 
     # Verify session exists and is active
-    session_before = test_db.query(Session).filter(Session.token == token).first()
+    session_before = (
+        test_db.query(Session).filter(Session.token_hash == hash_token(token)).first()
+    )
     assert session_before is not None
     assert session_before.is_active is True
 
@@ -187,10 +216,48 @@ def test_signout_deletes_session_from_database(authenticated_client, test_db):
 
     # Verify session is deactivated
     test_db.expire_all()  # Refresh from database
-    session_after = test_db.query(Session).filter(Session.token == token).first()
+    session_after = (
+        test_db.query(Session).filter(Session.token_hash == hash_token(token)).first()
+    )
     assert session_after.is_active is False
 
 
+def test_expired_session_is_rejected(authenticated_client, test_db):
+    """Test that a session past its expires_at no longer authenticates."""
+    # Arrange - move the session's expiry into the past
+    token = authenticated_client.headers["Authorization"][len("Bearer ") :]
+    session = (
+        test_db.query(Session).filter(Session.token_hash == hash_token(token)).first()
+    )
+    session.expires_at = datetime.utcnow() - timedelta(hours=1)
+    test_db.flush()
+
+    # Act
+    response = authenticated_client.get("/api/todos")
+
+    # Assert
+    assert response.status_code == 401
+
+
+def test_signout_deactivates_expired_session(authenticated_client, test_db):
+    """Test that signing out of an expired session still deactivates it."""
+    # Arrange - move the session's expiry into the past
+    token = authenticated_client.headers["Authorization"][len("Bearer ") :]
+    session = (
+        test_db.query(Session).filter(Session.token_hash == hash_token(token)).first()
+    )
+    session.expires_at = datetime.utcnow() - timedelta(hours=1)
+    test_db.flush()
+
+    # Act
+    response = authenticated_client.post("/api/auth/signout")
+
+    # Assert
+    assert response.status_code == 200
+    test_db.expire_all()
+    assert session.is_active is False
+
+
 def test_signout_returns_401_for_invalid_token(client):
     """Test signout fails with 401 for invalid token."""
     response = client.post(
@@ -201,10 +268,33 @@ def test_signout_returns_401_for_invalid_token(client):
     assert response.status_code == 401
 
 
+@pytest.mark.parametrize("header", ["Token abc", "Bearer", "Bearer "])
+def test_signout_returns_401_for_malformed_authorization_header(client, header):
+    """Test signout rejects headers that are not "Bearer {token}"."""
+    response = client.post(
+        "/api/auth/signout",
+        headers={"Authorization": header},
+    )
+
+    assert response.status_code == 401
+
+
+def test_signout_accepts_lowercase_bearer_scheme(authenticated_client):
+    """Test that the Bearer scheme is matched case-insensitively."""
+    token = authenticated_client.headers["Authorization"].split(" ", 1)[1]
+
+    response = authenticated_client.post(
+        "/api/auth/signout",
+        headers={"Authorization": f"bearer {token}"},
+    )
+
+    assert response.status_code == 200
+
+
 def test_protected_endpoint_requires_authentication(client):
     """Test that protected endpoints require authentication."""
     # This will be useful when we add protected endpoints
     # For now, test that signout requires authentication
     response = client.post("/api/auth/signout")
 
-    assert response.status_code == 422  # Missing Authorization header
+    assert response.status_code == 401  # Missing Authorization header
@@ -3,82 +3,71 @@ Integration tests for TODO API endpoints.
 """
 
 import pytest
+from datetime import datetime, timedelta
+from pydantic import ValidationError
+from sqlalchemy import insert
 from app.models.todo import Todo, TodoStatus
-from app.models.tag import Tag
-from app.models.user import User
-from app.core.security import hash_password
-
-
-@pytest.fixture
-def test_user2(test_db):
-    """Create a second test user."""
-    user = User(
-        email="testuser2@example.com",
-        name="Test User 2",
-        password_hash=hash_password("TestPass123!"),
-    )
-    test_db.add(user)
-    test_db.commit()
-    test_db.refresh(user)
-    return user
-
-
-@pytest.fixture
-def test_tags(test_db):
-    """Create test tags."""
-    tags = [
-        Tag(name="Work", color_code="#FF5733"),
-        Tag(name="Personal", color_code="#33FF57"),
-        Tag(name="Urgent", color_code="#5733FF"),
-    ]
-    for tag in tags:
-        test_db.add(tag)
-    test_db.commit()
-    for tag in tags:
-        test_db.refresh(tag)
-    return tags
+from app.models.todo_tag import TodoTag
+from app.schemas.todo import TODO_LIST_ADAPTER
+from tests.conftest import json_body
+
+# Over-length request bodies, pre-encoded once instead of serialized per test
+JSON_HEADERS = {"Content-Type": "application/json"}
+TITLE_TOO_LONG_BODY = b'{"title":"' + b"x" * 201 + b'"}'
+DESCRIPTION_TOO_LONG_BODY = (
+    b'{"title":"Valid title","description":"' + b"x" * 2001 + b'"}'
+)
+
+
+@pytest.fixture(scope="session")
+def tag_urls(reference_data):
+    """List URLs filtering by the reference tags, built once per run."""
+    work, _, urgent = (tag.id for tag in reference_data["tags"])
+    return {
+        "work": f"/api/todos?tag_ids={work}",
+        "work_urgent": f"/api/todos?tag_ids={work},{urgent}",
+        "work_urgent_repeated": f"/api/todos?tag_ids={work}&tag_ids={urgent}",
+        "pending_work": f"/api/todos?status=pending&tag_ids={work}",
+    }
 
 
 @pytest.fixture
 def test_todos(test_db, test_user, test_tags):
     """Create test TODOs with various statuses and tags."""
-    todos = [
-        Todo(
-            user_id=test_user.id,
-            title="Pending TODO 1",
-            description="First pending task",
-            status=TodoStatus.PENDING,
-        ),
-        Todo(
-            user_id=test_user.id,
-            title="In Progress TODO",
-            description="Task in progress",
-            status=TodoStatus.IN_PROGRESS,
-        ),
-        Todo(
-            user_id=test_user.id,
-            title="Completed TODO",
-            description="Completed task",
-            status=TodoStatus.COMPLETED,
-        ),
-        Todo(
-            user_id=test_user.id,
-            title="Pending TODO 2",
-            description="Second pending task",
-            status=TodoStatus.PENDING,
-        ),
+    # Explicit, strictly increasing created_at so ordering never ties. One
+    # ORM bulk INSERT ... RETURNING creates all rows without unit-of-work
+    # bookkeeping; RETURNING follows parameter order so indexes line up.
+    base = datetime(2024, 1, 1)
+    rows = [
+        ("Pending TODO 1", "First pending task", TodoStatus.PENDING),
+        ("In Progress TODO", "Task in progress", TodoStatus.IN_PROGRESS),
+        ("Completed TODO", "Completed task", TodoStatus.COMPLETED),
+        ("Pending TODO 2", "Second pending task", TodoStatus.PENDING),
     ]
-
-    # Add tags to some TODOs
-    todos[0].tags = [test_tags[0], test_tags[2]]  # Work, Urgent
-    todos[1].tags = [test_tags[1]]  # Personal
-    todos[2].tags = [test_tags[0]]  # Work
-
-    for todo in todos:
-        test_db.add(todo)
-    test_db.commit()
-    for todo in todos:
-        test_db.refresh(todo)
+    todos = test_db.scalars(
+        insert(Todo).returning(Todo, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": test_user.id,
+                "title": title,
+                "description": description,
+                "status": status,
+                "created_at": base + timedelta(seconds=i),
+            }
+            for i, (title, description, status) in enumerate(rows)
+        ],
+    ).all()
+
+    # Tag some TODOs with a single Core INSERT into the association table
+    test_db.execute(
+        insert(TodoTag),
+        [
+            {"todo_id": todos[0].id, "tag_id": test_tags[0].id},  # Work
+            {"todo_id": todos[0].id, "tag_id": test_tags[2].id},  # Urgent
+            {"todo_id": todos[1].id, "tag_id": test_tags[1].id},  # Personal
+            {"todo_id": todos[2].id, "tag_id": test_tags[0].id},  # Work
+        ],
+    )
 
     return todos
 
@@ -93,13 +82,14 @@ class TestListTodos:
 
         # Assert
         assert response.status_code == 200
-        todos = response.json()
+        # Validates every item against the TodoResponse schema in one pass
+        try:
+            todos = TODO_LIST_ADAPTER.validate_json(response.content)
+        except ValidationError as e:
+            pytest.fail(f"Response does not match list[TodoResponse]: {e}")
         assert len(todos) == 4
-        assert all("id" in todo for todo in todos)
-        assert all("title" in todo for todo in todos)
-        assert all("status" in todo for todo in todos)
-        assert all("tags" in todo for todo in todos)
 
+    @pytest.mark.no_db
     def test_list_todos_unauthenticated(self, client):
         """Test that unauthenticated request returns 401."""
         # Act
@@ -117,161 +107,148 @@ class TestListTodos:
 
         # Assert
         assert response.status_code == 200
-        todos = response.json()
+        todos = json_body(response)
         # The last created TODO should be first
         assert todos[0]["title"] == "Pending TODO 2"
         assert todos[-1]["title"] == "Pending TODO 1"
 
-    def test_list_todos_includes_tags(self, authenticated_client, test_todos):
-        """Test that TODOs include their tags with eager loading."""
-        # Act
-        response = authenticated_client.get("/api/todos")
-
-        # Assert
-        assert response.status_code == 200
-        todos = response.json()
-
-        # Find "Pending TODO 1" which has 2 tags
-        pending_todo_1 = next(
-            todo for todo in todos if todo["title"] == "Pending TODO 1"
-        )
-        assert len(pending_todo_1["tags"]) == 2
-        assert any(tag["name"] == "Work" for tag in pending_todo_1["tags"])
-        assert any(tag["name"] == "Urgent" for tag in pending_todo_1["tags"])
-
-    def test_list_todos_filter_by_status_pending(
-        self, authenticated_client, test_todos
+    def test_list_todos_includes_tags(
+        self, authenticated_client, test_db, test_todos, count_queries
     ):
-        """Test filtering TODOs by status=pending."""
-        # Act
-        response = authenticated_client.get("/api/todos?status=pending")
-
-        # Assert
-        assert response.status_code == 200
-        todos = response.json()
-        assert len(todos) == 2
-        assert all(todo["status"] == "pending" for todo in todos)
+        """Test that TODOs include their tags with eager loading."""
+        # Arrange - nothing preloaded in the identity map
+        test_db.expire_all()
 
-    def test_list_todos_filter_by_status_in_progress(
-        self, authenticated_client, test_todos
-    ):
-        """Test filtering TODOs by status=in_progress."""
         # Act
-        response = authenticated_client.get("/api/todos?status=in_progress")
+        with count_queries() as statements:
+            response = authenticated_client.get("/api/todos")
 
-        # Assert
+        # Assert - session lookup, TODOs, and one SELECT for all of their tags
         assert response.status_code == 200
-        todos = response.json()
-        assert len(todos) == 1
-        assert todos[0]["status"] == "in_progress"
-        assert todos[0]["title"] == "In Progress TODO"
+        assert len(statements) <= 3
+        todos = json_body(response)
 
-    def test_list_todos_filter_by_status_completed(
-        self, authenticated_client, test_todos
+        # Find "Pending TODO 1" which has 2 tags
+        by_title = {todo["title"]: todo for todo in todos}
+        pending_todo_1 = by_title["Pending TODO 1"]
+        tag_names = {tag["name"] for tag in pending_todo_1["tags"]}
+        assert tag_names == {"Work", "Urgent"}
+
+    @pytest.mark.parametrize(
+        "status,expected_titles",
+        [
+            ("pending", ["Pending TODO 2", "Pending TODO 1"]),
+            ("in_progress", ["In Progress TODO"]),
+            ("completed", ["Completed TODO"]),
+        ],
+    )
+    def test_list_todos_filter_by_status(
+        self, authenticated_client, test_todos, status, expected_titles
     ):
-        """Test filtering TODOs by status=completed."""
+        """Test filtering TODOs by each status."""
         # Act
-        response = authenticated_client.get("/api/todos?status=completed")
+        response = authenticated_client.get(f"/api/todos?status={status}")
 
         # Assert
         assert response.status_code == 200
-        todos = response.json()
-        assert len(todos) == 1
-        assert todos[0]["status"] == "completed"
-        assert todos[0]["title"] == "Completed TODO"
-
-    def test_list_todos_filter_by_invalid_status(
-        self, authenticated_client, test_todos
+        todos = json_body(response)
+        assert [todo["title"] for todo in todos] == expected_titles
+        assert all(todo["status"] == status for todo in todos)
+
+    @pytest.mark.parametrize(
+        "query,detail",
+        [
+            ("status=invalid_status", "Invalid status"),
+            ("tag_ids=abc,def", "Invalid tag_ids format"),
+            ("cursor=not-a-cursor", "Invalid cursor"),
+            ("offset=2&cursor=not-a-cursor", "either offset or cursor"),
+        ],
+    )
+    def test_list_todos_invalid_query(
+        self, authenticated_client, test_todos, query, detail
     ):
-        """Test that invalid status returns 400."""
+        """Test that malformed filter or pagination parameters return 400."""
         # Act
-        response = authenticated_client.get("/api/todos?status=invalid_status")
+        response = authenticated_client.get(f"/api/todos?{query}")
 
         # Assert
         assert response.status_code == 400
-        assert "Invalid status" in response.json()["detail"]
-
-    def test_list_todos_filter_by_single_tag(
-        self, authenticated_client, test_todos, test_tags
-    ):
-        """Test filtering TODOs by a single tag."""
-        # Act - Filter by "Work" tag
-        work_tag_id = test_tags[0].id
-        response = authenticated_client.get(f"/api/todos?tag_ids={work_tag_id}")
-
-        # Assert
-        assert response.status_code == 200
-        todos = response.json()
-        assert len(todos) == 2  # "Pending TODO 1" and "Completed TODO"
-        titles = [todo["title"] for todo in todos]
-        assert "Pending TODO 1" in titles
-        assert "Completed TODO" in titles
-
-    def test_list_todos_filter_by_multiple_tags(
-        self, authenticated_client, test_todos, test_tags
+        assert detail in json_body(response)["detail"]
+
+    @pytest.mark.parametrize(
+        "url_key",
+        [
+            "work",  # Work only
+            "work_urgent",  # Work or Urgent, comma-separated
+            "work_urgent_repeated",  # Work or Urgent, repeated parameters
+        ],
+    )
+    def test_list_todos_filter_by_tags(
+        self, authenticated_client, test_todos, tag_urls, url_key
     ):
-        """Test filtering TODOs by multiple tags."""
-        # Act - Filter by "Work" and "Urgent" tags
-        work_tag_id = test_tags[0].id
-        urgent_tag_id = test_tags[2].id
-        response = authenticated_client.get(
-            f"/api/todos?tag_ids={work_tag_id},{urgent_tag_id}"
-        )
+        """Test filtering TODOs by one or more tags."""
+        # Act
+        response = authenticated_client.get(tag_urls[url_key])
 
-        # Assert
+        # Assert - "Pending TODO 1" has both Work and Urgent but appears once
         assert response.status_code == 200
-        todos = response.json()
-        # Should return TODOs that have either Work OR Urgent tag
-        assert len(todos) >= 1
+        titles = sorted(todo["title"] for todo in json_body(response))
+        assert titles == ["Completed TODO", "Pending TODO 1"]
 
-    def test_list_todos_filter_by_invalid_tag_ids(
-        self, authenticated_client, test_todos
+    def test_list_todos_loads_tags_without_n_plus_one(
+        self, authenticated_client, test_db, test_todos, count_queries
     ):
-        """Test that invalid tag_ids format returns 400."""
-        # Act
-        response = authenticated_client.get("/api/todos?tag_ids=abc,def")
-
-        # Assert
-        assert response.status_code == 400
-        assert "Invalid tag_ids format" in response.json()["detail"]
+        """Test that listing TODOs with tags issues a constant number of queries."""
+        # Arrange - warm the session cache so only the listing itself queries
+        authenticated_client.get("/api/todos")
+        test_db.expire_all()
 
-    def test_list_todos_pagination_limit(self, authenticated_client, test_todos):
-        """Test pagination with limit parameter."""
         # Act
-        response = authenticated_client.get("/api/todos?limit=2")
+        with count_queries() as statements:
+            response = authenticated_client.get("/api/todos")
 
-        # Assert
+        # Assert - one SELECT for the TODOs and one for all of their tags
         assert response.status_code == 200
-        todos = response.json()
-        assert len(todos) == 2
-
-    def test_list_todos_pagination_offset(self, authenticated_client, test_todos):
-        """Test pagination with offset parameter."""
-        # Act - Get all TODOs first
-        all_response = authenticated_client.get("/api/todos")
-        all_todos = all_response.json()
-
-        # Get TODOs with offset
-        offset_response = authenticated_client.get("/api/todos?offset=2")
-        offset_todos = offset_response.json()
-
-        # Assert
-        assert offset_response.status_code == 200
-        assert len(offset_todos) == 2  # 4 total - 2 offset = 2 remaining
-        # The IDs should match the last 2 from all_todos
-        assert offset_todos[0]["id"] == all_todos[2]["id"]
+        assert len(json_body(response)) == 4
+        assert len(statements) <= 2
 
     def test_list_todos_pagination_limit_and_offset(
         self, authenticated_client, test_todos
     ):
-        """Test pagination with both limit and offset."""
-        # Act
-        response = authenticated_client.get("/api/todos?limit=1&offset=1")
+        """Test that limit and/or offset pages are slices of the full list."""
+        # Act - Get all TODOs once as the baseline
+        all_response = authenticated_client.get("/api/todos")
+        all_ids = [todo["id"] for todo in json_body(all_response)]
+        assert len(all_ids) == 4
+
+        # Assert - each page matches the same slice of the newest-first list
+        for query, expected_ids in (
+            ("limit=2", all_ids[:2]),
+            ("offset=2", all_ids[2:]),
+            ("limit=1&offset=1", all_ids[1:2]),
+        ):
+            response = authenticated_client.get(f"/api/todos?{query}")
+            assert response.status_code == 200, query
+            page_ids = [todo["id"] for todo in json_body(response)]
+            assert page_ids == expected_ids, query
+
+    def test_list_todos_pagination_cursor(self, authenticated_client, test_todos):
+        """Test walking the list page by page with X-Next-Cursor."""
+        # Act - Get all TODOs first, then the same list two at a time
+        all_response = authenticated_client.get("/api/todos")
+        all_ids = [todo["id"] for todo in json_body(all_response)]
 
-        # Assert
-        assert response.status_code == 200
-        todos = response.json()
-        assert len(todos) == 1
+        first_page = authenticated_client.get("/api/todos?limit=2")
+        cursor = first_page.headers["X-Next-Cursor"]
+        second_page = authenticated_client.get(f"/api/todos?limit=2&cursor={cursor}")
+
+        # Assert - the pages line up with the full list and the last page
+        # carries no cursor
+        assert second_page.status_code == 200
+        page_ids = [todo["id"] for todo in json_body(first_page)]
+        page_ids += [todo["id"] for todo in json_body(second_page)]
+        assert page_ids == all_ids
+        assert "X-Next-Cursor" not in second_page.headers
 
     def test_list_todos_limit_exceeds_maximum(self, authenticated_client, test_todos):
         """Test that limit is capped at 100."""
@@ -283,18 +260,15 @@ class TestListTodos:
         # Should still work, but internally capped at 100
 
     def test_list_todos_combined_filters(
-        self, authenticated_client, test_todos, test_tags
+        self, authenticated_client, test_todos, tag_urls
     ):
         """Test combining status and tag filters."""
         # Act - Filter by status=pending AND tag=Work
-        work_tag_id = test_tags[0].id
-        response = authenticated_client.get(
-            f"/api/todos?status=pending&tag_ids={work_tag_id}"
-        )
+        response = authenticated_client.get(tag_urls["pending_work"])
 
         # Assert
         assert response.status_code == 200
-        todos = response.json()
+        todos = json_body(response)
         assert len(todos) == 1
         assert todos[0]["title"] == "Pending TODO 1"
         assert todos[0]["status"] == "pending"
@@ -310,16 +284,16 @@ class TestListTodos:
             status=TodoStatus.PENDING,
         )
         test_db.add(user2_todo)
-        test_db.commit()
+        test_db.flush()
 
         # Act - User 1 lists their TODOs
         response = authenticated_client.get("/api/todos")
 
         # Assert
         assert response.status_code == 200
-        todos = response.json()
+        todos = json_body(response)
         # Should only see test_user's TODOs, not user2's
-        titles = [todo["title"] for todo in todos]
+        titles = {todo["title"] for todo in todos}
         assert "User 2 TODO" not in titles
         assert len(todos) == 4  # Only user 1's TODOs
 
@@ -330,7 +304,7 @@ class TestListTodos:
 
         # Assert
         assert response.status_code == 200
-        todos = response.json()
+        todos = json_body(response)
         assert todos == []
 
 
@@ -341,13 +315,12 @@ class TestCreateTodo:
         """Test creating a TODO with minimal required data."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={"title": "Buy groceries"}
+            "/api/todos", json={"title": "Buy groceries"}
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert todo["title"] == "Buy groceries"
         assert todo["status"] == "pending"  # Default
         assert todo["description"] is None
@@ -368,13 +341,13 @@ class TestCreateTodo:
                 "status": "in_progress",
                 "starts_date": "2026-02-08T10:00:00Z",
                 "expires_date": "2026-02-15T18:00:00Z",
-                "tag_ids": [test_tags[0].id, test_tags[1].id]
-            }
+                "tag_ids": [test_tags[0].id, test_tags[1].id],
+            },
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert todo["title"] == "Complete project"
         assert todo["description"] == "Finish the TODO app implementation"
         assert todo["status"] == "in_progress"
@@ -388,27 +361,33 @@ class TestCreateTodo:
         """Test creating a TODO with a single tag."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={
-                "title": "Tagged task",
-                "tag_ids": [test_tags[0].id]
-            }
+            "/api/todos", json={"title": "Tagged task", "tag_ids": [test_tags[0].id]}
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert len(todo["tags"]) == 1
         assert todo["tags"][0]["name"] == "Work"
 
-    def test_create_todo_unauthenticated(self, client):
-        """Test that unauthenticated request returns 401."""
+    def test_create_todo_with_unknown_tag(self, authenticated_client, test_tags):
+        """Test that creating a TODO with a nonexistent tag returns 400."""
         # Act
-        response = client.post(
+        response = authenticated_client.post(
             "/api/todos",
-            json={"title": "Test TODO"}
+            json={"title": "Tagged task", "tag_ids": [test_tags[0].id, 9999]},
         )
 
+        # Assert
+        assert response.status_code == 400
+        assert "9999" in json_body(response)["detail"]
+
+    @pytest.mark.no_db
+    def test_create_todo_unauthenticated(self, client):
+        """Test that unauthenticated request returns 401."""
+        # Act
+        response = client.post("/api/todos", json={"title": "Test TODO"})
+
         # Assert
         assert response.status_code == 401
 
@@ -419,16 +398,13 @@ class TestCreateTodo:
 
         # Assert
         assert response.status_code == 422
-        error = response.json()
+        error = json_body(response)
         assert "detail" in error
 
     def test_create_todo_empty_title(self, authenticated_client):
         """Test that empty title returns 422."""
         # Act
-        response = authenticated_client.post(
-            "/api/todos",
-            json={"title": ""}
-        )
+        response = authenticated_client.post("/api/todos", json={"title": ""})
 
         # Assert
         assert response.status_code == 422
@@ -437,8 +413,7 @@ class TestCreateTodo:
         """Test that title longer than 200 chars returns 422."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={"title": "x" * 201}
+            "/api/todos", content=TITLE_TOO_LONG_BODY, headers=JSON_HEADERS
         )
 
         # Assert
@@ -448,11 +423,7 @@ class TestCreateTodo:
         """Test that description longer than 2000 chars returns 422."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={
-                "title": "Valid title",
-                "description": "x" * 2001
-            }
+            "/api/todos", content=DESCRIPTION_TOO_LONG_BODY, headers=JSON_HEADERS
         )
 
         # Assert
@@ -462,11 +433,7 @@ class TestCreateTodo:
         """Test that invalid status value returns 422."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={
-                "title": "Test TODO",
-                "status": "invalid_status"
-            }
+            "/api/todos", json={"title": "Test TODO", "status": "invalid_status"}
         )
 
         # Assert
@@ -480,13 +447,13 @@ class TestCreateTodo:
             json={
                 "title": "Invalid dates",
                 "starts_date": "2026-02-15T10:00:00Z",
-                "expires_date": "2026-02-08T10:00:00Z"
-            }
+                "expires_date": "2026-02-08T10:00:00Z",
+            },
         )
 
         # Assert
         assert response.status_code == 422
-        error = response.json()
+        error = json_body(response)
         assert "expires_date" in str(error).lower()
 
     def test_create_todo_with_dates(self, authenticated_client):
@@ -497,13 +464,13 @@ class TestCreateTodo:
             json={
                 "title": "Dated task",
                 "starts_date": "2026-02-08T10:00:00Z",
-                "expires_date": "2026-02-15T18:00:00Z"
-            }
+                "expires_date": "2026-02-15T18:00:00Z",
+            },
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert todo["starts_date"] is not None
         assert todo["expires_date"] is not None
 
@@ -511,13 +478,12 @@ class TestCreateTodo:
         """Test that default status is 'pending'."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={"title": "Default status task"}
+            "/api/todos", json={"title": "Default status task"}
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert todo["status"] == "pending"
 
     def test_create_todo_with_description_only(self, authenticated_client):
@@ -527,13 +493,13 @@ class TestCreateTodo:
             "/api/todos",
             json={
                 "title": "Simple task",
-                "description": "This is a simple description"
-            }
+                "description": "This is a simple description",
+            },
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert todo["description"] == "This is a simple description"
         assert todo["status"] == "pending"
         assert todo["starts_date"] is None
@@ -543,13 +509,12 @@ class TestCreateTodo:
         """Test that response includes created_at and updated_at."""
         # Act
         response = authenticated_client.post(
-            "/api/todos",
-            json={"title": "Timestamp test"}
+            "/api/todos", json={"title": "Timestamp test"}
         )
 
         # Assert
         assert response.status_code == 201
-        todo = response.json()
+        todo = json_body(response)
         assert "created_at" in todo
         assert "updated_at" in todo
         assert todo["created_at"] is not None
@@ -559,18 +524,16 @@ class TestCreateTodo:
         """Test creating multiple TODOs for the same user."""
         # Act
         response1 = authenticated_client.post(
-            "/api/todos",
-            json={"title": "First TODO"}
+            "/api/todos", json={"title": "First TODO"}
         )
         response2 = authenticated_client.post(
-            "/api/todos",
-            json={"title": "Second TODO"}
+            "/api/todos", json={"title": "Second TODO"}
         )
 
         # Assert
         assert response1.status_code == 201
         assert response2.status_code == 201
-        todo1 = response1.json()
-        todo2 = response2.json()
+        todo1 = json_body(response1)
+        todo2 = json_body(response2)
         assert todo1["id"] != todo2["id"]
         assert todo1["user_id"] == todo2["user_id"]
@@ -0,0 +1,169 @@
+"""
+Integration tests for TodoRepository against the test database.
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
+from app.models.todo import Todo, TodoStatus
+from app.models.todo_tag import TodoTag
+from app.repositories.todo_repository import TodoRepository
+
+
+@pytest.fixture
+def todo_repo(test_db):
+    """TodoRepository bound to this test's session."""
+    return TodoRepository(test_db)
+
+
+@pytest.fixture
+def owned_todo(todo_repo, test_db, test_user, test_tags):
+    """A TODO owned by test_user, tagged Work and Urgent."""
+    todo = todo_repo.create(
+        user_id=test_user.id,
+        title="Owned TODO",
+        description="Belongs to test_user",
+        tag_ids=[test_tags[0].id, test_tags[2].id],
+    )
+    # Start each test from the database, not the identity map
+    test_db.expunge_all()
+    return todo
+
+
+class TestGetForUser:
+    """Tests for TodoRepository.get_for_user."""
+
+    def test_get_for_user_returns_owned_todo(self, todo_repo, test_user, owned_todo):
+        """Test that the owner gets their TODO with its tags loaded."""
+        # Act
+        todo = todo_repo.get_for_user(owned_todo.id, test_user.id)
+
+        # Assert
+        assert todo is not None
+        assert todo.id == owned_todo.id
+        assert todo.title == "Owned TODO"
+        assert {tag.name for tag in todo.tags} == {"Work", "Urgent"}
+
+    def test_get_for_user_misses_other_users_todo(
+        self, todo_repo, test_user2, owned_todo
+    ):
+        """Test that another user's TODO is not returned."""
+        # Act
+        todo = todo_repo.get_for_user(owned_todo.id, test_user2.id)
+
+        # Assert
+        assert todo is None
+
+    def test_get_for_user_misses_unknown_id(self, todo_repo, test_user):
+        """Test that an unknown TODO ID returns None."""
+        # Act
+        todo = todo_repo.get_for_user(999999, test_user.id)
+
+        # Assert
+        assert todo is None
+
+
+class TestExists:
+    """Tests for TodoRepository.exists."""
+
+    def test_exists_for_any_owner(self, todo_repo, owned_todo):
+        """Test that exists() finds a TODO regardless of who owns it."""
+        # Act & Assert
+        assert todo_repo.exists(owned_todo.id) is True
+
+    def test_exists_false_for_unknown_id(self, todo_repo):
+        """Test that exists() is False for an unknown TODO ID."""
+        # Act & Assert
+        assert todo_repo.exists(999999) is False
+
+
+class TestGetAllForUser:
+    """Tests for TodoRepository.get_all_for_user."""
+
+    def test_get_all_for_user_forbids_lazy_loads(
+        self, todo_repo, test_user, owned_todo
+    ):
+        """Test that listed TODOs raise instead of lazy-loading relationships."""
+        # Act
+        todos = todo_repo.get_all_for_user(test_user.id)
+
+        # Assert - tags were eager-loaded; any other relationship raises
+        assert [len(todo.tags) for todo in todos] == [2]
+        with pytest.raises(InvalidRequestError):
+            todos[0].user
+
+
+class TestUpdateForUser:
+    """Tests for TodoRepository.update_for_user."""
+
+    def test_update_for_user_returns_refreshed_todo_with_tags(
+        self, todo_repo, test_user, owned_todo
+    ):
+        """Test that the owner's update returns the new row with tags loaded."""
+        # Act
+        todo = todo_repo.update_for_user(
+            owned_todo.id,
+            test_user.id,
+            title="Renamed TODO",
+            status=TodoStatus.COMPLETED,
+        )
+
+        # Assert - new values, untouched columns kept, tags usable detached
+        assert todo is not None
+        assert todo.title == "Renamed TODO"
+        assert todo.status == TodoStatus.COMPLETED
+        assert todo.description == "Belongs to test_user"
+        assert {tag.name for tag in todo.tags} == {"Work", "Urgent"}
+
+    def test_update_for_user_persists_change(
+        self, todo_repo, test_db, test_user, owned_todo
+    ):
+        """Test that the update is written to the database."""
+        # Act
+        todo_repo.update_for_user(owned_todo.id, test_user.id, title="Renamed TODO")
+
+        # Assert
+        stmt = select(Todo.title).where(Todo.id == owned_todo.id)
+        assert test_db.scalar(stmt) == "Renamed TODO"
+
+    def test_update_for_user_rejects_non_owner(
+        self, todo_repo, test_db, test_user2, owned_todo
+    ):
+        """Test that another user cannot update the TODO."""
+        # Act
+        todo = todo_repo.update_for_user(owned_todo.id, test_user2.id, title="Hijacked")
+
+        # Assert
+        assert todo is None
+        stmt = select(Todo.title).where(Todo.id == owned_todo.id)
+        assert test_db.scalar(stmt) == "Owned TODO"
+
+
+class TestDeleteForUser:
+    """Tests for TodoRepository.delete_for_user."""
+
+    def test_delete_for_user_removes_todo_and_tag_links(
+        self, todo_repo, test_db, test_user, owned_todo
+    ):
+        """Test that the owner's delete removes the TODO and its todo_tags rows."""
+        # Act
+        deleted = todo_repo.delete_for_user(owned_todo.id, test_user.id)
+
+        # Assert
+        assert deleted is True
+        assert todo_repo.exists(owned_todo.id) is False
+        links = select(func.count()).where(TodoTag.todo_id == owned_todo.id)
+        assert test_db.scalar(links) == 0
+
+    def test_delete_for_user_rejects_non_owner(
+        self, todo_repo, test_db, test_user2, owned_todo
+    ):
+        """Test that another user cannot delete the TODO or its tag links."""
+        # Act
+        deleted = todo_repo.delete_for_user(owned_todo.id, test_user2.id)
+
+        # Assert
+        assert deleted is False
+        assert todo_repo.exists(owned_todo.id) is True
+        links = select(func.count()).where(TodoTag.todo_id == owned_todo.id)
+        assert test_db.scalar(links) == 2
@@ -3,7 +3,7 @@ Unit tests for AuthService.
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
 from app.services.auth_service import AuthService
@@ -13,33 +13,53 @@ from app.core.exceptions import (
     UserAlreadyExistsError,
     InvalidCredentialsError,
     SessionNotFoundError,
-    SessionExpiredError,
 )
-from app.core.security import hash_password
+from app.core.security import hash_password, verify_password, DUMMY_PASSWORD_HASH
 
+# Expiry for sessions that must still be valid. AuthService compares it with
+# the real clock, so it is anchored to import time rather than a fixed date;
+# a day of headroom keeps it valid for the whole run.
+SESSION_EXPIRES_AT = datetime.utcnow() + timedelta(hours=24)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_user_repo():
-    """Mock UserRepository."""
+    """Mock UserRepository, shared across the module."""
     return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_session_repo():
-    """Mock SessionRepository."""
+    """Mock SessionRepository, shared across the module."""
     return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_service(mock_user_repo, mock_session_repo):
-    """AuthService with mocked repositories."""
+    """AuthService with mocked repositories, shared across the module."""
     return AuthService(mock_user_repo, mock_session_repo)
 
 
+@pytest.fixture(scope="session")
+def hashed_passwords():
+    """bcrypt hashes of the passwords used below, computed once per run."""
+    return {
+        password: hash_password(password)
+        for password in ("Password123!", "CorrectPassword123!")
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_repo_mocks(mock_user_repo, mock_session_repo):
+    """Forget calls, return values and side effects after each test."""
+    yield
+    mock_user_repo.reset_mock(return_value=True, side_effect=True)
+    mock_session_repo.reset_mock(return_value=True, side_effect=True)
+
+
 def test_signup_creates_user_with_hashed_password(auth_service, mock_user_repo):
     """Test successful user creation with hashed password."""
     # Arrange
-    mock_user_repo.email_exists.return_value = False
     mock_user = User(id=1, email="new@example.com", name="New User")
     mock_user_repo.create.return_value = mock_user
 
@@ -49,7 +69,6 @@ def test_signup_creates_user_with_hashed_password(auth_service, mock_user_repo):
     # Assert
     assert user.id == 1
     assert user.email == "new@example.com"
-    mock_user_repo.email_exists.assert_called_once_with("new@example.com")
     mock_user_repo.create.assert_called_once()
     # Verify password was hashed (not stored as plain text)
     call_args = mock_user_repo.create.call_args[1]
@@ -59,7 +78,9 @@ def test_signup_creates_user_with_hashed_password(auth_service, mock_user_repo):
 def test_signup_raises_error_on_duplicate_email(auth_service, mock_user_repo):
     """Test signup fails when email already exists."""
     # Arrange
-    mock_user_repo.email_exists.return_value = True
+    mock_user_repo.create.side_effect = UserAlreadyExistsError(
+        "User with email existing@example.com already exists"
+    )
 
     # Act & Assert
     with pytest.raises(UserAlreadyExistsError):
@@ -67,15 +88,18 @@ def test_signup_raises_error_on_duplicate_email(auth_service, mock_user_repo):
 
 
 def test_signin_returns_token_and_user_for_valid_credentials(
-    auth_service, mock_user_repo, mock_session_repo
+    auth_service, mock_user_repo, mock_session_repo, hashed_passwords
 ):
     """Test successful sign in with valid credentials."""
     # Arrange
-    password_hash = hash_password("Password123!")
-    mock_user = User(id=1, email="user@example.com", password_hash=password_hash)
+    mock_user = User(
+        id=1,
+        email="user@example.com",
+        password_hash=hashed_passwords["Password123!"],
+    )
     mock_user_repo.get_by_email.return_value = mock_user
 
-    mock_session = Session(id=1, user_id=1, token="test_token")
+    mock_session = Session(id=1, user_id=1)
     mock_session_repo.create.return_value = mock_session
 
     # Act
@@ -85,29 +109,75 @@ def test_signin_returns_token_and_user_for_valid_credentials(
     assert user.id == 1
     assert token is not None
     mock_user_repo.get_by_email.assert_called_once_with("user@example.com")
+    mock_user_repo.update_password_hash.assert_not_called()
     mock_session_repo.create.assert_called_once()
 
 
-def test_signin_raises_error_for_invalid_email(auth_service, mock_user_repo):
-    """Test signin fails for non-existent email."""
+def test_signin_rehashes_password_from_old_scheme(
+    auth_service, mock_user_repo, hashed_passwords
+):
+    """Test signin stores a fresh hash when the stored one is outdated."""
     # Arrange
-    mock_user_repo.get_by_email.return_value = None
+    mock_user = User(
+        id=1,
+        email="user@example.com",
+        password_hash=hashed_passwords["Password123!"],
+    )
+    mock_user_repo.get_by_email.return_value = mock_user
+
+    # Act
+    with patch("app.services.auth_service.needs_rehash", return_value=True):
+        auth_service.signin("user@example.com", "Password123!")
+
+    # Assert
+    mock_user_repo.update_password_hash.assert_called_once()
+    user, new_hash = mock_user_repo.update_password_hash.call_args[0]
+    assert user is mock_user
+    assert new_hash != hashed_passwords["Password123!"]
+    assert verify_password("Password123!", new_hash)
+
+
+@pytest.mark.parametrize(
+    "email_registered,password",
+    [
+        (False, "Password123!"),  # Unknown email
+        (True, "WrongPassword123!"),  # Known email, wrong password
+    ],
+    ids=["invalid_email", "invalid_password"],
+)
+def test_signin_raises_error_for_invalid_credentials(
+    auth_service, mock_user_repo, hashed_passwords, email_registered, password
+):
+    """Test signin fails alike for an unknown email or a wrong password."""
+    # Arrange
+    mock_user_repo.get_by_email.return_value = (
+        User(
+            id=1,
+            email="user@example.com",
+            password_hash=hashed_passwords["CorrectPassword123!"],
+        )
+        if email_registered
+        else None
+    )
 
     # Act & Assert
     with pytest.raises(InvalidCredentialsError):
-        auth_service.signin("nonexistent@example.com", "Password123!")
+        auth_service.signin("user@example.com", password)
 
 
-def test_signin_raises_error_for_invalid_password(auth_service, mock_user_repo):
-    """Test signin fails for incorrect password."""
+def test_signin_verifies_dummy_hash_for_unknown_email(auth_service, mock_user_repo):
+    """Test signin still runs a password check when the email is unknown."""
     # Arrange
-    password_hash = hash_password("CorrectPassword123!")
-    mock_user = User(id=1, email="user@example.com", password_hash=password_hash)
-    mock_user_repo.get_by_email.return_value = mock_user
+    mock_user_repo.get_by_email.return_value = None
 
     # Act & Assert
-    with pytest.raises(InvalidCredentialsError):
-        auth_service.signin("user@example.com", "WrongPassword123!")
+    with patch(
+        "app.services.auth_service.verify_password", return_value=True
+    ) as mock_verify:
+        with pytest.raises(InvalidCredentialsError):
+            auth_service.signin("nonexistent@example.com", "Password123!")
+
+    mock_verify.assert_called_once_with("Password123!", DUMMY_PASSWORD_HASH)
 
 
 def test_signout_deletes_session(auth_service, mock_session_repo):
@@ -137,17 +207,14 @@ def test_get_current_user_returns_user_for_valid_token(
 ):
     """Test getting current user with valid token."""
     # Arrange
+    mock_user = User(id=1, email="user@example.com")
     mock_session = Session(
         id=1,
         user_id=1,
-        token="valid_token",
-        expires_at=datetime.utcnow() + timedelta(hours=24),
+        expires_at=SESSION_EXPIRES_AT,
+        user=mock_user,
     )
     mock_session_repo.get_by_token.return_value = mock_session
-    mock_session_repo.is_expired.return_value = False
-
-    mock_user = User(id=1, email="user@example.com")
-    mock_user_repo.get_by_id.return_value = mock_user
 
     # Act
     user = auth_service.get_current_user("valid_token")
@@ -155,38 +222,59 @@ def test_get_current_user_returns_user_for_valid_token(
     # Assert
     assert user.id == 1
     mock_session_repo.get_by_token.assert_called_once_with("valid_token")
-    mock_user_repo.get_by_id.assert_called_once_with(1)
+    # The user comes with the session; it is only detached, never looked up
+    assert [name for name, _, _ in mock_user_repo.method_calls] == ["detach"]
 
 
-def test_get_current_user_raises_error_for_invalid_token(
-    auth_service, mock_session_repo
+def test_get_current_user_caches_resolved_session(
+    auth_service, mock_user_repo, mock_session_repo
 ):
-    """Test getting current user fails for invalid token."""
+    """Test that a resolved token is served from cache on repeat calls."""
     # Arrange
+    mock_user = User(id=1, email="user@example.com")
+    mock_session_repo.get_by_token.return_value = Session(
+        id=1,
+        user_id=1,
+        expires_at=SESSION_EXPIRES_AT,
+        user=mock_user,
+    )
+
+    # Act
+    first = auth_service.get_current_user("valid_token")
+    second = auth_service.get_current_user("valid_token")
+
+    # Assert
+    assert first is second is mock_user
+    mock_session_repo.get_by_token.assert_called_once_with("valid_token")
+    mock_user_repo.detach.assert_called_once_with(mock_user)
+
+
+def test_signout_evicts_cached_session(auth_service, mock_session_repo):
+    """Test that signout stops a cached token from authenticating."""
+    # Arrange - resolve (and cache) the token, then sign out
+    mock_session_repo.get_by_token.return_value = Session(
+        id=1,
+        user_id=1,
+        expires_at=SESSION_EXPIRES_AT,
+        user=User(id=1, email="user@example.com"),
+    )
+    auth_service.get_current_user("valid_token")
+    mock_session_repo.delete.return_value = True
+    auth_service.signout("valid_token")
     mock_session_repo.get_by_token.return_value = None
 
     # Act & Assert
     with pytest.raises(SessionNotFoundError):
-        auth_service.get_current_user("invalid_token")
+        auth_service.get_current_user("valid_token")
 
 
-def test_get_current_user_raises_error_for_expired_token(
+def test_get_current_user_raises_error_for_invalid_token(
     auth_service, mock_session_repo
 ):
-    """Test getting current user fails for expired token."""
-    # Arrange
-    mock_session = Session(
-        id=1,
-        user_id=1,
-        token="expired_token",
-        expires_at=datetime.utcnow() - timedelta(hours=1),
-    )
-    mock_session_repo.get_by_token.return_value = mock_session
-    mock_session_repo.is_expired.return_value = True
+    """Test getting current user fails for invalid or expired token."""
+    # Arrange - the repository filters out unknown and expired sessions alike
+    mock_session_repo.get_by_token.return_value = None
 
     # Act & Assert
-    with pytest.raises(SessionExpiredError):
-        auth_service.get_current_user("expired_token")
-
-    # Verify expired session was deleted
-    mock_session_repo.delete.assert_called_once_with("expired_token")
+    with pytest.raises(SessionNotFoundError):
+        auth_service.get_current_user("invalid_token")
@@ -2,7 +2,13 @@
 Unit tests for security utilities.
 """
 
-from app.core.security import hash_password, verify_password, generate_token
+from app.core.security import (
+    hash_password,
+    verify_password,
+    needs_rehash,
+    generate_token,
+    hash_token,
+)
 
 
 def test_hash_password_returns_different_hash_each_time():
@@ -33,14 +39,35 @@ def test_verify_password_with_wrong_password():
     assert verify_password(wrong_password, hashed) is False
 
 
+def test_verify_password_returns_false_for_malformed_hash():
+    """Test that an unrecognized hash format fails verification instead of raising."""
+    assert verify_password("Password123!", "not-a-hash") is False
+    assert verify_password("Password123!", "") is False
+
+
+def test_needs_rehash_false_for_current_scheme():
+    """Test that a hash made with the configured scheme is kept as is."""
+    assert needs_rehash(hash_password("Password123!")) is False
+
+
 def test_generate_token_returns_unique_tokens():
     """Test that token generation produces unique tokens."""
-    token1 = generate_token()
-    token2 = generate_token()
+    tokens = [generate_token() for _ in range(1000)]
 
-    assert token1 != token2
-    assert len(token1) > 0
-    assert len(token2) > 0
+    assert len(set(tokens)) == len(tokens)
+    # 16 random bytes, base64url-encoded without padding
+    assert {len(token) for token in tokens} == {22}
     # Tokens should be URL-safe
-    assert "/" not in token1
-    assert "+" not in token1
+    joined = "".join(tokens)
+    assert "/" not in joined
+    assert "+" not in joined
+    assert "=" not in joined
+
+
+def test_hash_token_is_deterministic_fixed_length_digest():
+    """Test that token hashing is stable and yields a 32-byte digest."""
+    token = generate_token()
+
+    assert hash_token(token) == hash_token(token)
+    assert len(hash_token(token)) == 32
+    assert hash_token(token) != hash_token(generate_token())
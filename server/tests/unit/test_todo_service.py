@@ -3,25 +3,60 @@ Unit tests for TodoService.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from datetime import datetime
+from unittest.mock import Mock
 from app.services.todo_service import TodoService
-from app.models.todo import Todo, TodoStatus
+from app.models.todo import TodoStatus
 from app.schemas.todo import TodoCreate, TodoUpdate
 from app.core.exceptions import TodoNotFoundError, UnauthorizedAccessError
+from app.core.pagination import decode_cursor, encode_cursor
 
-
-@pytest.fixture
+# Request payloads validated once at import; the service only reads them
+CREATE_DATA = TodoCreate(
+    title="New TODO",
+    description="Description",
+    status=TodoStatus.PENDING,
+)
+UPDATE_DATA = TodoUpdate(title="Updated Title")
+UPDATE_TAGS_DATA = TodoUpdate(tag_ids=[1, 2])
+
+# Repository kwargs for get_todos_for_user(user_id=1) with default arguments:
+# limit 50 plus one look-ahead row
+DEFAULT_REPO_KWARGS = {
+    "user_id": 1,
+    "status": None,
+    "tag_ids": None,
+    "limit": 51,
+    "offset": 0,
+    "before": None,
+}
+
+
+@pytest.fixture(scope="module")
 def mock_todo_repo():
-    """Create a mock TodoRepository."""
+    """Create a mock TodoRepository, shared across the module."""
     return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def todo_service(mock_todo_repo):
-    """Create TodoService with mocked repository."""
+    """Create TodoService with mocked repository, shared across the module."""
     return TodoService(mock_todo_repo)
 
 
+@pytest.fixture(autouse=True)
+def reset_repo_mock(mock_todo_repo):
+    """Forget calls, return values and side effects after each test."""
+    yield
+    mock_todo_repo.reset_mock(return_value=True, side_effect=True)
+
+
+class FakeTodo:
+    """Plain stand-in for a Todo row; far cheaper than Mock(spec=Todo)."""
+
+    __slots__ = ("id", "user_id", "title", "status", "tags", "created_at")
+
+
 def create_mock_todo(
     todo_id=1,
     user_id=1,
@@ -30,58 +65,77 @@ def create_mock_todo(
     tags=None,
 ):
     """Helper to create a mock TODO."""
-    todo = Mock(spec=Todo)
+    todo = FakeTodo()
     todo.id = todo_id
     todo.user_id = user_id
     todo.title = title
     todo.status = status
     todo.tags = tags or []
+    todo.created_at = None
     return todo
 
 
-class TestGetTodosForUser:
-    """Tests for get_todos_for_user method."""
-
-    def test_get_todos_no_filters(self, todo_service, mock_todo_repo):
-        """Test getting all TODOs without filters."""
-        # Arrange
-        mock_todos = [
-            create_mock_todo(1, 1, "TODO 1"),
-            create_mock_todo(2, 1, "TODO 2"),
-        ]
-        mock_todo_repo.get_all_for_user.return_value = mock_todos
+@pytest.fixture(scope="class")
+def owned_todo():
+    """A TODO owned by user 1, shared by the tests of one class."""
+    return create_mock_todo(1, 1, "Test TODO")
 
-        # Act
-        result = todo_service.get_todos_for_user(user_id=1)
 
-        # Assert
-        assert len(result) == 2
-        mock_todo_repo.get_all_for_user.assert_called_once_with(
-            user_id=1,
-            status=None,
-            tag_ids=None,
-            limit=50,
-            offset=0,
-        )
+class TestGetTodosForUser:
+    """Tests for get_todos_for_user method."""
 
-    def test_get_todos_with_status_filter(self, todo_service, mock_todo_repo):
-        """Test filtering TODOs by status."""
-        # Arrange
-        mock_todos = [create_mock_todo(1, 1, "TODO 1", status=TodoStatus.PENDING)]
+    @pytest.mark.parametrize(
+        "kwargs,expected_repo_kwargs,returned_count",
+        [
+            # No filters: defaults, plus one look-ahead row
+            ({}, {}, 2),
+            ({"status": "pending"}, {"status": "pending"}, 1),
+            ({"tag_ids": [1, 2]}, {"tag_ids": [1, 2]}, 1),
+            ({"limit": 10, "offset": 20}, {"limit": 11, "offset": 20}, 10),
+            # Limit capped at 100, plus one look-ahead row
+            ({"limit": 200}, {"limit": 101}, 0),
+            (
+                {"status": "in_progress", "tag_ids": [1], "limit": 25, "offset": 10},
+                {"status": "in_progress", "tag_ids": [1], "limit": 26, "offset": 10},
+                1,
+            ),
+            ({}, {}, 0),  # Empty result
+        ],
+        ids=[
+            "no_filters",
+            "status_filter",
+            "tag_filter",
+            "pagination",
+            "limit_capped_at_100",
+            "combined_filters",
+            "empty_result",
+        ],
+    )
+    def test_get_todos_delegates_to_repository(
+        self,
+        todo_service,
+        mock_todo_repo,
+        kwargs,
+        expected_repo_kwargs,
+        returned_count,
+    ):
+        """Test that filters and pagination are passed through to the repository."""
+        # Arrange - the service never inspects rows on a short page, so
+        # placeholders stand in for TODOs
+        mock_todos = [None] * returned_count
         mock_todo_repo.get_all_for_user.return_value = mock_todos
 
         # Act
-        result = todo_service.get_todos_for_user(user_id=1, status="pending")
+        result, next_cursor = todo_service.get_todos_for_user(user_id=1, **kwargs)
 
         # Assert
-        assert len(result) == 1
-        mock_todo_repo.get_all_for_user.assert_called_once_with(
-            user_id=1,
-            status="pending",
-            tag_ids=None,
-            limit=50,
-            offset=0,
-        )
+        assert result == mock_todos
+        assert next_cursor is None
+        assert mock_todo_repo.get_all_for_user.call_count == 1
+        assert mock_todo_repo.get_all_for_user.call_args.kwargs == {
+            **DEFAULT_REPO_KWARGS,
+            **expected_repo_kwargs,
+        }
 
     def test_get_todos_with_invalid_status(self, todo_service, mock_todo_repo):
         """Test that invalid status raises ValueError."""
@@ -92,163 +146,116 @@ class TestGetTodosForUser:
         assert "Invalid status" in str(exc_info.value)
         mock_todo_repo.get_all_for_user.assert_not_called()
 
-    def test_get_todos_with_tag_filter(self, todo_service, mock_todo_repo):
-        """Test filtering TODOs by tags."""
+    def test_get_todos_returns_next_cursor_when_more_rows(
+        self, todo_service, mock_todo_repo
+    ):
+        """Test that a look-ahead row is dropped and turned into a cursor."""
         # Arrange
-        mock_todos = [create_mock_todo(1, 1, "TODO 1")]
+        mock_todos = [create_mock_todo(i, 1, f"TODO {i}") for i in (3, 2, 1)]
+        for i, todo in enumerate(mock_todos):
+            todo.created_at = datetime(2024, 1, 1, 0, 0, 3 - i)
         mock_todo_repo.get_all_for_user.return_value = mock_todos
 
         # Act
-        result = todo_service.get_todos_for_user(user_id=1, tag_ids=[1, 2])
+        result, next_cursor = todo_service.get_todos_for_user(user_id=1, limit=2)
 
         # Assert
-        assert len(result) == 1
-        mock_todo_repo.get_all_for_user.assert_called_once_with(
-            user_id=1,
-            status=None,
-            tag_ids=[1, 2],
-            limit=50,
-            offset=0,
-        )
+        assert [todo.id for todo in result] == [3, 2]
+        assert decode_cursor(next_cursor) == (datetime(2024, 1, 1, 0, 0, 2), 2)
 
-    def test_get_todos_with_pagination(self, todo_service, mock_todo_repo):
-        """Test pagination with limit and offset."""
-        # Arrange
-        mock_todos = [create_mock_todo(i, 1, f"TODO {i}") for i in range(10)]
-        mock_todo_repo.get_all_for_user.return_value = mock_todos
-
-        # Act
-        result = todo_service.get_todos_for_user(
-            user_id=1, limit=10, offset=20
-        )
-
-        # Assert
-        assert len(result) == 10
-        mock_todo_repo.get_all_for_user.assert_called_once_with(
-            user_id=1,
-            status=None,
-            tag_ids=None,
-            limit=10,
-            offset=20,
-        )
-
-    def test_get_todos_limit_capped_at_100(self, todo_service, mock_todo_repo):
-        """Test that limit is capped at 100."""
+    def test_get_todos_with_cursor(self, todo_service, mock_todo_repo):
+        """Test that a cursor is decoded into the repository keyset."""
         # Arrange
         mock_todo_repo.get_all_for_user.return_value = []
+        cursor = encode_cursor(datetime(2024, 1, 1), 7)
 
         # Act
-        todo_service.get_todos_for_user(user_id=1, limit=200)
+        todo_service.get_todos_for_user(user_id=1, cursor=cursor)
 
         # Assert
-        mock_todo_repo.get_all_for_user.assert_called_once_with(
-            user_id=1,
-            status=None,
-            tag_ids=None,
-            limit=100,  # Should be capped
-            offset=0,
-        )
-
-    def test_get_todos_combined_filters(self, todo_service, mock_todo_repo):
-        """Test combining status and tag filters with pagination."""
-        # Arrange
-        mock_todos = [create_mock_todo(1, 1, "TODO 1", status=TodoStatus.IN_PROGRESS)]
-        mock_todo_repo.get_all_for_user.return_value = mock_todos
-
-        # Act
-        result = todo_service.get_todos_for_user(
-            user_id=1,
-            status="in_progress",
-            tag_ids=[1],
-            limit=25,
-            offset=10,
-        )
+        assert mock_todo_repo.get_all_for_user.call_count == 1
+        assert mock_todo_repo.get_all_for_user.call_args.kwargs == {
+            **DEFAULT_REPO_KWARGS,
+            "before": (datetime(2024, 1, 1), 7),
+        }
+
+    def test_get_todos_with_invalid_cursor(self, todo_service, mock_todo_repo):
+        """Test that a malformed cursor raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            todo_service.get_todos_for_user(user_id=1, cursor="not-a-cursor")
 
-        # Assert
-        assert len(result) == 1
-        mock_todo_repo.get_all_for_user.assert_called_once_with(
-            user_id=1,
-            status="in_progress",
-            tag_ids=[1],
-            limit=25,
-            offset=10,
-        )
+        assert "Invalid cursor" in str(exc_info.value)
+        mock_todo_repo.get_all_for_user.assert_not_called()
 
-    def test_get_todos_empty_result(self, todo_service, mock_todo_repo):
-        """Test that empty result is handled correctly."""
+    def test_get_todos_rejects_offset_with_cursor(self, todo_service, mock_todo_repo):
+        """Test that combining offset and cursor raises ValueError."""
         # Arrange
-        mock_todo_repo.get_all_for_user.return_value = []
+        cursor = encode_cursor(datetime(2024, 1, 1), 7)
 
-        # Act
-        result = todo_service.get_todos_for_user(user_id=1)
+        # Act & Assert
+        with pytest.raises(ValueError, match="either offset or cursor"):
+            todo_service.get_todos_for_user(user_id=1, offset=2, cursor=cursor)
 
-        # Assert
-        assert result == []
-        mock_todo_repo.get_all_for_user.assert_called_once()
+        mock_todo_repo.get_all_for_user.assert_not_called()
 
 
 class TestGetTodo:
     """Tests for get_todo method."""
 
-    def test_get_todo_success(self, todo_service, mock_todo_repo):
+    def test_get_todo_success(self, todo_service, mock_todo_repo, owned_todo):
         """Test getting a TODO by ID with valid authorization."""
         # Arrange
-        mock_todo = create_mock_todo(1, 1, "Test TODO")
-        mock_todo_repo.get_by_id.return_value = mock_todo
+        mock_todo_repo.get_for_user.return_value = owned_todo
 
         # Act
         result = todo_service.get_todo(todo_id=1, user_id=1)
 
         # Assert
-        assert result == mock_todo
-        mock_todo_repo.get_by_id.assert_called_once_with(1)
+        assert result is owned_todo
+        mock_todo_repo.get_for_user.assert_called_once_with(1, 1)
+        mock_todo_repo.exists.assert_not_called()
 
     def test_get_todo_not_found(self, todo_service, mock_todo_repo):
         """Test that TodoNotFoundError is raised when TODO doesn't exist."""
         # Arrange
-        mock_todo_repo.get_by_id.return_value = None
+        mock_todo_repo.get_for_user.return_value = None
+        mock_todo_repo.exists.return_value = False
 
         # Act & Assert
-        with pytest.raises(TodoNotFoundError) as exc_info:
+        with pytest.raises(TodoNotFoundError, match="not found"):
             todo_service.get_todo(todo_id=999, user_id=1)
 
-        assert "not found" in str(exc_info.value)
-        mock_todo_repo.get_by_id.assert_called_once_with(999)
+        mock_todo_repo.get_for_user.assert_called_once_with(999, 1)
+        mock_todo_repo.exists.assert_called_once_with(999)
 
     def test_get_todo_unauthorized(self, todo_service, mock_todo_repo):
         """Test that UnauthorizedAccessError is raised for other user's TODO."""
         # Arrange
-        mock_todo = create_mock_todo(1, 2, "Other user's TODO")  # user_id=2
-        mock_todo_repo.get_by_id.return_value = mock_todo
+        # TODO 1 exists but is not owned by user_id=1
+        mock_todo_repo.get_for_user.return_value = None
+        mock_todo_repo.exists.return_value = True
 
         # Act & Assert
-        with pytest.raises(UnauthorizedAccessError) as exc_info:
+        with pytest.raises(UnauthorizedAccessError, match="permission"):
             todo_service.get_todo(todo_id=1, user_id=1)  # Requesting as user_id=1
 
-        assert "permission" in str(exc_info.value).lower()
-        mock_todo_repo.get_by_id.assert_called_once_with(1)
+        mock_todo_repo.get_for_user.assert_called_once_with(1, 1)
 
 
 class TestCreateTodo:
     """Tests for create_todo method."""
 
-    def test_create_todo_success(self, todo_service, mock_todo_repo):
+    def test_create_todo_success(self, todo_service, mock_todo_repo, owned_todo):
         """Test creating a TODO successfully."""
         # Arrange
-        mock_todo = create_mock_todo(1, 1, "New TODO")
-        mock_todo_repo.create.return_value = mock_todo
-
-        create_data = TodoCreate(
-            title="New TODO",
-            description="Description",
-            status=TodoStatus.PENDING,
-        )
+        mock_todo_repo.create.return_value = owned_todo
 
         # Act
-        result = todo_service.create_todo(user_id=1, data=create_data)
+        result = todo_service.create_todo(user_id=1, data=CREATE_DATA)
 
         # Assert
-        assert result == mock_todo
+        assert result is owned_todo
         mock_todo_repo.create.assert_called_once()
         call_args = mock_todo_repo.create.call_args[1]
         assert call_args["user_id"] == 1
@@ -259,23 +266,47 @@ class TestCreateTodo:
 class TestUpdateTodo:
     """Tests for update_todo method."""
 
-    def test_update_todo_success(self, todo_service, mock_todo_repo):
+    def test_update_todo_success(self, todo_service, mock_todo_repo, owned_todo):
         """Test updating a TODO successfully."""
         # Arrange
+        mock_todo_repo.update_for_user.return_value = owned_todo
+
+        # Act
+        result = todo_service.update_todo(todo_id=1, user_id=1, data=UPDATE_DATA)
+
+        # Assert
+        assert result is owned_todo
+        mock_todo_repo.update_for_user.assert_called_once_with(
+            1, 1, title="Updated Title"
+        )
+        mock_todo_repo.get_for_user.assert_not_called()
+
+    def test_update_todo_with_tags(self, todo_service, mock_todo_repo):
+        """Test that changing tags loads the TODO and updates it."""
+        # Arrange
         mock_todo = create_mock_todo(1, 1, "Original Title")
-        updated_todo = create_mock_todo(1, 1, "Updated Title")
-        mock_todo_repo.get_by_id.return_value = mock_todo
+        updated_todo = create_mock_todo(1, 1, "Original Title")
+        mock_todo_repo.get_for_user.return_value = mock_todo
         mock_todo_repo.update.return_value = updated_todo
 
-        update_data = TodoUpdate(title="Updated Title")
-
         # Act
-        result = todo_service.update_todo(todo_id=1, user_id=1, data=update_data)
+        result = todo_service.update_todo(todo_id=1, user_id=1, data=UPDATE_TAGS_DATA)
 
         # Assert
         assert result == updated_todo
-        mock_todo_repo.get_by_id.assert_called_once_with(1)
-        mock_todo_repo.update.assert_called_once()
+        mock_todo_repo.get_for_user.assert_called_once_with(1, 1)
+        mock_todo_repo.update.assert_called_once_with(mock_todo, tag_ids=[1, 2])
+        mock_todo_repo.update_for_user.assert_not_called()
+
+    def test_update_todo_not_found(self, todo_service, mock_todo_repo):
+        """Test that updating a missing TODO raises TodoNotFoundError."""
+        # Arrange
+        mock_todo_repo.update_for_user.return_value = None
+        mock_todo_repo.exists.return_value = False
+
+        # Act & Assert
+        with pytest.raises(TodoNotFoundError):
+            todo_service.update_todo(todo_id=999, user_id=1, data=UPDATE_DATA)
 
 
 class TestDeleteTodo:
@@ -284,24 +315,23 @@ class TestDeleteTodo:
     def test_delete_todo_success(self, todo_service, mock_todo_repo):
         """Test deleting a TODO successfully."""
         # Arrange
-        mock_todo = create_mock_todo(1, 1, "TODO to delete")
-        mock_todo_repo.get_by_id.return_value = mock_todo
+        mock_todo_repo.delete_for_user.return_value = True
 
         # Act
         todo_service.delete_todo(todo_id=1, user_id=1)
 
         # Assert
-        mock_todo_repo.get_by_id.assert_called_once_with(1)
-        mock_todo_repo.delete.assert_called_once_with(mock_todo)
+        mock_todo_repo.delete_for_user.assert_called_once_with(1, 1)
+        mock_todo_repo.exists.assert_not_called()
 
     def test_delete_todo_unauthorized(self, todo_service, mock_todo_repo):
         """Test that unauthorized user cannot delete TODO."""
-        # Arrange
-        mock_todo = create_mock_todo(1, 2, "Other user's TODO")
-        mock_todo_repo.get_by_id.return_value = mock_todo
+        # Arrange - TODO 1 exists but is owned by another user
+        mock_todo_repo.delete_for_user.return_value = False
+        mock_todo_repo.exists.return_value = True
 
         # Act & Assert
         with pytest.raises(UnauthorizedAccessError):
             todo_service.delete_todo(todo_id=1, user_id=1)
 
-        mock_todo_repo.delete.assert_not_called()
+        mock_todo_repo.delete_for_user.assert_called_once_with(1, 1)